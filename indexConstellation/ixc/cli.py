@@ -5,26 +5,30 @@ This router is intentionally thin: it provides a single *door* (`ixc <command>`)
 while keeping the system modular under `packages/ixc-*`.
 
 Commands currently implemented:
-- demo: runs a tiny end-to-end example using the existing pipeline runner.
+- demo: runs a tiny end-to-end example using the existing pipeline runner
+  (in-process, no interpreter spawn).
 
 Other commands are stubbed as help links to the module CLIs/scripts.
 """
 from __future__ import annotations
 
 import argparse
-import subprocess
 import sys
 from pathlib import Path
 
 SUITE_ROOT = Path(__file__).resolve().parent.parent
 
-def _run(cmd: list[str]) -> int:
-    return subprocess.call(cmd, cwd=str(SUITE_ROOT))
+# Make the suite-level `pipeline` package importable when running from a
+# source checkout, so the demo runs in-process instead of spawning Python.
+if str(SUITE_ROOT) not in sys.path:
+    sys.path.insert(0, str(SUITE_ROOT))
 
 def cmd_demo(_: argparse.Namespace) -> int:
+    from pipeline.runner import main as runner_main
+
     sample = SUITE_ROOT / "apps" / "browser" / "sample.json"
     out = SUITE_ROOT / "out.demo.jsonl"
-    return _run([sys.executable, "pipeline/runner.py", "--input", str(sample), "--out", str(out)])
+    return runner_main(["--input", str(sample), "--output", str(out)])
 
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(prog="ixc", description="indexConstellation unified CLI (router).")
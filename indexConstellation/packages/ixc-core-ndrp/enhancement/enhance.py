@@ -22,8 +22,11 @@ def enhance_entry(entry: Mapping[str, Any]) -> dict:
         entry: A standardized NDRP entry
         
     Returns:
-        The enhanced NDRP entry (currently unchanged in v1)
+        The enhanced NDRP entry (currently unchanged in v1). Plain dicts
+        are returned as the same object rather than copied; callers that
+        need an independent copy must make one.
     """
     # v1 stub: return entry as-is
-    # Future enhancement logic will be added here
-    return dict(entry)
+    # Future enhancement logic will be added here, copying before the
+    # first mutation
+    return entry if isinstance(entry, dict) else dict(entry)
@@ -3,78 +3,193 @@ Mode classifier for NDRP extraction stage.
 
 Detects the mode/type of text entries using simple heuristics.
 """
-from typing import Literal
+import functools
+from typing import Dict, Iterable, List, Literal, Optional, Tuple
 
 
 ModeType = Literal["instruction", "conversation", "narrative", "reasoning", "context", "meta", "emotion", "other"]
 
 
-def detect_mode(text: str) -> ModeType:
-    """
-    Detect the mode of a text entry using simple heuristics.
-    
-    This is a basic classifier that uses text patterns to determine
-    the likely mode of the entry. More sophisticated classification
-    can be added in future versions.
-    
-    Args:
-        text: The text to classify
-        
-    Returns:
-        One of: "instruction", "conversation", "narrative", "reasoning",
-                "context", "meta", "emotion", "other"
-    """
-    text_lower = text.lower()
-    
+# Marker groups in priority order: when a text contains markers from several
+# groups, the group listed first wins.
+MODE_MARKERS: Tuple[Tuple[ModeType, Tuple[str, ...]], ...] = (
     # Reasoning patterns (check first - more specific)
-    reasoning_markers = [
+    ("reasoning", (
         "because", "therefore", "thus", "hence",
         "consequently", "as a result", "this means",
-        "let's think", "step by step", "first,", "second,"
-    ]
-    if any(marker in text_lower for marker in reasoning_markers):
-        return "reasoning"
-    
+        "let's think", "step by step", "first,", "second,",
+    )),
     # Instruction patterns
-    instruction_markers = [
+    ("instruction", (
         "how to", "please", "can you", "could you", "would you",
         "tell me", "show me", "explain", "describe", "define",
-        "what is", "what are", "why", "when", "where"
-    ]
-    if any(marker in text_lower for marker in instruction_markers):
-        return "instruction"
-    
+        "what is", "what are", "why", "when", "where",
+    )),
     # Narrative patterns (check before conversation - more specific)
-    narrative_markers = [
+    ("narrative", (
         "once upon", "story", "tale", "long ago",
-        "there was", "there were", "in the beginning"
-    ]
-    if any(marker in text_lower for marker in narrative_markers):
-        return "narrative"
-    
+        "there was", "there were", "in the beginning",
+    )),
     # Conversation patterns
-    conversation_markers = [
+    ("conversation", (
         "hello", "hi ", " hey ", "thanks", "thank you",
-        "goodbye", "bye", "see you", "nice to"
-    ]
-    if any(marker in text_lower for marker in conversation_markers):
-        return "conversation"
-    
+        "goodbye", "bye", "see you", "nice to",
+    )),
     # Emotion patterns
-    emotion_markers = [
+    ("emotion", (
         "feel", "feeling", "felt", "emotion", "happy", "sad",
-        "angry", "excited", "worried", "anxious", "love", "hate"
-    ]
-    if any(marker in text_lower for marker in emotion_markers):
-        return "emotion"
-    
+        "angry", "excited", "worried", "anxious", "love", "hate",
+    )),
     # Meta patterns (discussing the conversation itself)
-    meta_markers = [
+    ("meta", (
         "this conversation", "our discussion", "what we're talking about",
-        "the topic", "let's change", "back to"
-    ]
-    if any(marker in text_lower for marker in meta_markers):
-        return "meta"
-    
-    # Default to "other" if no clear pattern is detected
-    return "other"
+        "the topic", "let's change", "back to",
+    )),
+)
+
+
+# Every marker paired with the index of its group in MODE_MARKERS. The table
+# is in priority order, so the first marker found in a text identifies the
+# winning group.
+_PRIORITY_MARKERS: Tuple[Tuple[str, int], ...] = tuple(
+    (marker, priority)
+    for priority, (_, markers) in enumerate(MODE_MARKERS)
+    for marker in markers
+)
+
+_NO_MATCH = len(MODE_MARKERS)
+
+# Mode name for every priority returned by _scan_priority, including the
+# trailing "other" slot used when nothing matched.
+_MODE_BY_PRIORITY: Tuple[ModeType, ...] = tuple(mode for mode, _ in MODE_MARKERS) + ("other",)
+
+
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator; see the "fast" extra
+    ahocorasick = None
+
+
+def _build_automaton():
+    """
+    Compile every marker into one Aho-Corasick automaton whose payload is the
+    priority of the marker's group, so a single traversal of the text reports
+    every marker hit. Returns None when pyahocorasick is not installed.
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for marker, priority in _PRIORITY_MARKERS:
+        if marker not in automaton:
+            automaton.add_word(marker, priority)
+    automaton.make_automaton()
+    return automaton
+
+
+_AUTOMATON = _build_automaton()
+
+
+def _scan_priority(text_lower: str) -> int:
+    """
+    Return the priority of the first marker group found in ``text_lower``,
+    or ``_NO_MATCH`` when no marker matches.
+    """
+    # Short chat lines are often nothing but a marker ("thanks", "hello"),
+    # and nothing shorter than the shortest marker can match at all.
+    if len(text_lower) < _MIN_MARKER_LENGTH:
+        return _NO_MATCH
+    exact = _EXACT_PRIORITY.get(text_lower)
+    if exact is not None:
+        return exact
+
+    return _search_priority(text_lower)
+
+
+def _search_priority(text_lower: str) -> int:
+    if _AUTOMATON is None:
+        for marker, priority in _PRIORITY_MARKERS:
+            if marker in text_lower:
+                return priority
+        return _NO_MATCH
+
+    best = _NO_MATCH
+    for _, priority in _AUTOMATON.iter(text_lower):
+        if priority < best:
+            best = priority
+            if best == 0:
+                break
+    return best
+
+
+_MIN_MARKER_LENGTH = min(len(marker) for marker, _ in _PRIORITY_MARKERS)
+
+# Texts consisting of exactly one marker, resolved once at import. A marker
+# may itself contain a higher-priority marker, so each is scanned rather than
+# assumed to belong to its own group.
+_EXACT_PRIORITY: Dict[str, int] = {
+    marker: _search_priority(marker) for marker, _ in _PRIORITY_MARKERS
+}
+
+
+# Lines longer than this are almost always unique, so they bypass the
+# detect_mode cache instead of evicting the short repeated lines it is for.
+_MAX_CACHED_LENGTH = 512
+
+
+def _detect_mode_uncached(text: str) -> ModeType:
+    text_lower = text.lower()
+
+    # Falls through to "other" if no clear pattern is detected
+    return _MODE_BY_PRIORITY[_scan_priority(text_lower)]
+
+
+_detect_mode_cached = functools.lru_cache(maxsize=65536)(_detect_mode_uncached)
+
+
+def detect_mode(text: str, text_lower: Optional[str] = None) -> ModeType:
+    """
+    Detect the mode of a text entry using simple heuristics.
+
+    This is a basic classifier that uses text patterns to determine
+    the likely mode of the entry. More sophisticated classification
+    can be added in future versions.
+
+    When pyahocorasick is available all marker groups are matched in a
+    single pass over the lowercased text; otherwise the markers are scanned
+    as one flat table in priority order and the first hit wins. Results for
+    short texts are memoized, since raw inputs repeat lines such as "thanks"
+    or "ok" many times.
+
+    Args:
+        text: The text to classify
+        text_lower: Optional ``text.lower()`` already computed by the
+                    caller; when given it is scanned directly instead of
+                    lowercasing ``text`` again
+
+    Returns:
+        One of: "instruction", "conversation", "narrative", "reasoning",
+                "context", "meta", "emotion", "other"
+    """
+    if text_lower is not None:
+        return _MODE_BY_PRIORITY[_scan_priority(text_lower)]
+    if len(text) > _MAX_CACHED_LENGTH:
+        return _detect_mode_uncached(text)
+    return _detect_mode_cached(text)
+
+
+def detect_modes(texts: Iterable[str]) -> List[ModeType]:
+    """
+    Detect the mode of many text entries at once.
+
+    Equivalent to ``[detect_mode(t) for t in texts]`` but drives the
+    per-entry loop through ``map`` so it runs in C rather than in Python
+    bytecode.
+
+    Args:
+        texts: The texts to classify
+
+    Returns:
+        A list of modes, one per input text, in input order
+    """
+    return list(map(detect_mode, texts))
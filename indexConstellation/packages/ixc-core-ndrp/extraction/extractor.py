@@ -3,7 +3,7 @@ Entry extractor for NDRP extraction stage.
 
 Converts raw text lines into preliminary NDRP entries with metadata.
 """
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Iterable, Optional, Any, Mapping
 
 from .classifier import detect_mode
@@ -22,9 +22,27 @@ class PreNDRPEntry:
         content: The raw text content
         metadata: Extraction metadata (source, mode, etc.)
     """
+    # Declared by hand (rather than dataclass(slots=True)) to keep
+    # Python 3.9 support; one of these is allocated per extracted line.
+    __slots__ = ("content", "metadata")
+
     content: str
     metadata: ExtractionMetadata
 
+    def to_dict(self) -> dict:
+        """
+        Flatten the entry into the dictionary shape produced by
+        ``extract_entries_as_dicts``.
+        
+        Use this rather than ``dataclasses.asdict``, which deep-copies
+        recursively and nests the metadata.
+        """
+        return {
+            "content": self.content,
+            "source": self.metadata.source,
+            "mode": self.metadata.mode,
+        }
+
 
 def extract_entries(
     lines: Iterable[str],
@@ -64,8 +82,9 @@ def extract_entries_as_dicts(
     """
     Extract preliminary NDRP entries as dictionaries.
     
-    This is a convenience function that converts PreNDRPEntry objects
-    to flat dictionaries suitable for downstream processing.
+    This is a convenience function that produces the same data as
+    PreNDRPEntry objects, flattened into dictionaries suitable for
+    downstream processing.
     
     Args:
         lines: Iterable of raw text lines
@@ -74,11 +93,11 @@ def extract_entries_as_dicts(
     Yields:
         Dictionary representations of preliminary entries
     """
-    for entry in extract_entries(lines, source):
-        # Convert to a flat dictionary for easier processing
-        entry_dict = {
-            "content": entry.content,
-            "source": entry.metadata.source,
-            "mode": entry.metadata.mode,
+    # Build the flat dictionaries directly rather than allocating a
+    # PreNDRPEntry and ExtractionMetadata per line only to unpack them.
+    for line in lines:
+        yield {
+            "content": line,
+            "source": source,
+            "mode": detect_mode(line),
         }
-        yield entry_dict
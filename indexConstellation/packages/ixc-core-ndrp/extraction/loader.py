@@ -8,10 +8,23 @@ from pathlib import Path
 from typing import Iterable, Union
 
 
+# Characters read per block; lines are split out of each block in C rather
+# than being pulled from the file object one at a time.
+READ_CHUNK_SIZE = 1 << 20
+
+
+def _non_empty(lines: Iterable[str]) -> Iterable[str]:
+    """Strip each line and drop the ones left empty."""
+    return filter(None, map(str.strip, lines))
+
+
 def load_raw_lines(path: Union[str, Path]) -> Iterable[str]:
     """
     Load raw lines from a text file, yielding non-empty lines.
     
+    The file is read in blocks of ``READ_CHUNK_SIZE`` characters, so memory
+    use stays bounded for large inputs.
+    
     Args:
         path: Path to the text file to load
         
@@ -20,8 +33,19 @@ def load_raw_lines(path: Union[str, Path]) -> Iterable[str]:
     """
     path = Path(path)
     
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:  # Only yield non-empty lines
-                yield line
+    with open(path, "r", encoding="utf-8", buffering=READ_CHUNK_SIZE) as f:
+        tail = ""
+        while True:
+            block = f.read(READ_CHUNK_SIZE)
+            if not block:
+                break
+
+            # Text mode has already translated \r and \r\n to \n, so this
+            # splits exactly where iterating the file would.
+            lines = (tail + block).split("\n")
+            tail = lines.pop()
+            yield from _non_empty(lines)
+
+        tail = tail.strip()
+        if tail:
+            yield tail
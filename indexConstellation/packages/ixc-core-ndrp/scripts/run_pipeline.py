@@ -5,7 +5,7 @@ NDRP Pipeline Runner
 This script runs the complete NDRP pipeline from raw text to refined JSONL.
 
 Usage:
-    python scripts/run_pipeline.py <input.txt> <output.jsonl>
+    python scripts/run_pipeline.py <input.txt> <output.jsonl> [--workers N]
 
 The pipeline consists of three stages:
 1. Extraction - Load raw text and extract preliminary entries
@@ -16,26 +16,95 @@ Output:
     A JSONL file where each line is a complete NDRP entry conforming to
     the schema defined in schema/entry_schema.json
 """
+import argparse
 import sys
-import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from extraction.loader import load_raw_lines
-from extraction.extractor import extract_entries_as_dicts
-from standardization.rewrite import to_ndrp_entry
+from extraction.classifier import detect_mode
+from standardization.rewrite import build_ndrp_entry
+from standardization.serialize import dumps_line
+from standardization.unify_style import normalize_text
 from enhancement.enhance import enhance_entry
 
+# Output is written through one large binary buffer rather than a text-mode
+# writer, with one write per entry.
+OUTPUT_BUFFER_SIZE = 1 << 20
 
-def run_pipeline(input_path: str, output_path: str):
+# Lines handed to a worker process per task when running with --workers.
+WORKER_CHUNK_SIZE = 10000
+
+
+def process_lines(lines, source=None):
+    """
+    Run extraction, standardization and enhancement on each line in turn.
+    
+    Produces the same entries as chaining ``extract_entries_as_dicts``,
+    ``to_ndrp_entry`` and ``enhance_entry``, but builds each NDRP entry
+    straight from the line instead of passing it through an intermediate
+    preliminary-entry dict.
+    
+    Args:
+        lines: Iterable of raw text lines
+        source: Optional source identifier for metadata
+        
+    Yields:
+        Enhanced NDRP entries, one per line
+    """
+    for line in lines:
+        ndrp_entry = build_ndrp_entry(normalize_text(line), detect_mode(line), source)
+        yield enhance_entry(ndrp_entry)
+
+
+def _process_chunk(lines, source):
+    """
+    Worker task: run the fused stages over a chunk of lines.
+    
+    Returns the number of entries and their serialized JSONL bytes, so the
+    parent process only has to write the blob.
+    """
+    blob = b"".join(dumps_line(entry) for entry in process_lines(lines, source))
+    return len(lines), blob
+
+
+def _process_in_workers(lines, source, workers):
+    """
+    Run ``_process_chunk`` over ``WORKER_CHUNK_SIZE``-line chunks on a
+    process pool, yielding results in input order. At most two chunks per
+    worker are in flight, bounding memory on large inputs.
+    """
+    line_iter = iter(lines)
+
+    def next_chunk():
+        return list(islice(line_iter, WORKER_CHUNK_SIZE))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        while True:
+            while len(pending) < workers * 2:
+                chunk = next_chunk()
+                if not chunk:
+                    break
+                pending.append(executor.submit(_process_chunk, chunk, source))
+            if not pending:
+                break
+            yield pending.popleft().result()
+
+
+def run_pipeline(input_path: str, output_path: str, workers: int = 1):
     """
     Run the complete NDRP pipeline.
     
     Args:
         input_path: Path to raw text file
         output_path: Path to output JSONL file
+        workers: Number of worker processes; 1 runs everything in-process
     """
     input_path = Path(input_path)
     output_path = Path(output_path)
@@ -58,29 +127,26 @@ def run_pipeline(input_path: str, output_path: str):
     
     entries_processed = 0
     
-    with open(output_path, "w", encoding="utf-8") as out_file:
+    with open(output_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as out_file:
         print("Stage 1: Extraction...")
         
         # Load raw lines
         raw_lines = load_raw_lines(input_path)
         
-        # Extract preliminary entries
-        pre_entries = extract_entries_as_dicts(raw_lines, source=source_name)
-        
+        # Stages run fused, line by line, as the output is written
         print("Stage 2: Standardization...")
+        print("Stage 3: Enhancement...")
         
-        for pre_entry in pre_entries:
-            # Standardize to NDRP format
-            ndrp_entry = to_ndrp_entry(pre_entry)
-            
-            # Stage 3: Enhancement
-            enhanced_entry = enhance_entry(ndrp_entry)
-            
-            # Write to output file
-            json.dump(enhanced_entry, out_file)
-            out_file.write("\n")
-            
-            entries_processed += 1
+        if workers > 1:
+            for count, blob in _process_in_workers(raw_lines, source_name, workers):
+                out_file.write(blob)
+                entries_processed += count
+        else:
+            for enhanced_entry in process_lines(raw_lines, source=source_name):
+                # Write to output file
+                out_file.write(dumps_line(enhanced_entry))
+                
+                entries_processed += 1
     
     print(f"\n✨ Pipeline complete!")
     print(f"Processed {entries_processed} entries")
@@ -91,17 +157,25 @@ def run_pipeline(input_path: str, output_path: str):
 
 
 def main():
-    if len(sys.argv) != 3:
-        print("Usage: python scripts/run_pipeline.py <input.txt> <output.jsonl>")
-        print()
-        print("Example:")
-        print("  python scripts/run_pipeline.py examples/sample_raw.txt output/refined.jsonl")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Run the NDRP pipeline from raw text to refined JSONL.",
+        epilog="Example:\n  python scripts/run_pipeline.py examples/sample_raw.txt output/refined.jsonl",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("input", help="Raw text input file")
+    parser.add_argument("output", help="JSONL output file")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for large inputs (default: 1, in-process)",
+    )
+    args = parser.parse_args()
     
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
     
-    run_pipeline(input_file, output_file)
+    run_pipeline(args.input, args.output, workers=args.workers)
 
 
 if __name__ == "__main__":
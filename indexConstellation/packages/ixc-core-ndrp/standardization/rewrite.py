@@ -3,12 +3,51 @@ NDRP entry rewriter for standardization stage.
 
 Converts preliminary entries into full NDRP-compliant entries.
 """
-from typing import Mapping, Any
+from typing import Dict, FrozenSet, Mapping, Any, Optional, TypedDict
 
 from .unify_style import normalize_text
 
 
-def to_ndrp_entry(pre_entry: Mapping[str, Any]) -> dict:
+class _NDRPEntryRequired(TypedDict):
+    role: str
+    content: str
+    intent: str
+    mode: str
+    context: Optional[str]
+    meaning_preserved: bool
+    density_goal: str
+    entropy_class: str
+
+
+class NDRPEntry(_NDRPEntryRequired, total=False):
+    """
+    Static shape of the entries produced by this stage.
+    
+    A TypedDict, so entries stay plain dicts at runtime: they serialize
+    directly to JSON and flow through enhancement and validation without
+    conversion.
+    """
+    metadata: Dict[str, Any]
+
+
+# The schema allows: instruction, conversation, narrative, reasoning, context, meta, emotion
+_VALID_MODES: FrozenSet[str] = frozenset((
+    "instruction", "conversation", "narrative", "reasoning", "context", "meta", "emotion",
+))
+
+# Intent recorded for each mode
+_INTENT_MAP: Dict[str, str] = {
+    "instruction": "request information or action",
+    "conversation": "engage in dialogue",
+    "narrative": "tell a story or describe events",
+    "reasoning": "explain logic or reasoning",
+    "context": "provide contextual information",
+    "meta": "discuss the conversation itself",
+    "emotion": "express feelings or emotions",
+}
+
+
+def to_ndrp_entry(pre_entry: Mapping[str, Any]) -> NDRPEntry:
     """
     Convert a preliminary entry to a full NDRP entry.
     
@@ -29,26 +68,34 @@ def to_ndrp_entry(pre_entry: Mapping[str, Any]) -> dict:
     # Get mode from extraction
     mode = pre_entry.get("mode", "other")
     
+    return build_ndrp_entry(content, mode, pre_entry.get("source"))
+
+
+def build_ndrp_entry(content: str, mode: str, source: Optional[str] = None) -> NDRPEntry:
+    """
+    Build a full NDRP entry from already-normalized fields.
+    
+    This is the body of ``to_ndrp_entry`` without the intermediate
+    preliminary-entry mapping, for callers that have the normalized
+    content and detected mode in hand.
+    
+    Args:
+        content: Normalized entry content
+        mode: Mode detected during extraction
+        source: Optional source identifier recorded in metadata
+        
+    Returns:
+        A complete NDRP entry dictionary with all required fields
+    """
     # Map mode to a valid schema mode if needed
-    # The schema allows: instruction, conversation, narrative, reasoning, context, meta, emotion
-    valid_modes = ["instruction", "conversation", "narrative", "reasoning", "context", "meta", "emotion"]
-    if mode not in valid_modes:
+    if mode not in _VALID_MODES:
         mode = "context"  # Default fallback
     
     # Determine intent based on mode
-    intent_map = {
-        "instruction": "request information or action",
-        "conversation": "engage in dialogue",
-        "narrative": "tell a story or describe events",
-        "reasoning": "explain logic or reasoning",
-        "context": "provide contextual information",
-        "meta": "discuss the conversation itself",
-        "emotion": "express feelings or emotions"
-    }
-    intent = intent_map.get(mode, "provide information")
+    intent = _INTENT_MAP.get(mode, "provide information")
     
     # Build the NDRP entry with required fields
-    ndrp_entry = {
+    ndrp_entry: NDRPEntry = {
         "role": "user",  # Default to user; can be overridden by caller
         "content": content,
         "intent": intent,
@@ -60,9 +107,9 @@ def to_ndrp_entry(pre_entry: Mapping[str, Any]) -> dict:
     }
     
     # Add optional metadata if present
-    if "source" in pre_entry and pre_entry["source"]:
+    if source:
         ndrp_entry["metadata"] = {
-            "source_id": pre_entry["source"]
+            "source_id": source
         }
     
     return ndrp_entry
@@ -0,0 +1,27 @@
+"""
+JSONL serialization for NDRP entries.
+
+Shared by the pipeline scripts so every writer produces the same lines.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; see the "fast" extra
+    orjson = None
+
+
+def dumps_line(entry) -> bytes:
+    """
+    Serialize one entry as a compact, newline-terminated UTF-8 JSON line.
+
+    Uses orjson when available; the stdlib fallback (also used for values
+    orjson rejects, such as integers beyond 64 bits or non-str keys)
+    produces the same compact encoding.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            pass
+    return (json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
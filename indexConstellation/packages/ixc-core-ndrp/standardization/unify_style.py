@@ -3,6 +3,20 @@ Text normalization for NDRP standardization stage.
 
 Provides utilities for normalizing text style and formatting.
 """
+import functools
+
+
+# Longer inputs are rarely repeated; they bypass the cache so it stays small.
+_MAX_CACHED_LENGTH = 1024
+
+
+def _normalize_text_uncached(text: str) -> str:
+    # str.split() with no separator already drops leading/trailing
+    # whitespace, so no separate strip() pass is needed.
+    return " ".join(text.split())
+
+
+_normalize_text_cached = functools.lru_cache(maxsize=16384)(_normalize_text_uncached)
 
 
 def normalize_text(text: str) -> str:
@@ -14,16 +28,15 @@ def normalize_text(text: str) -> str:
     - Collapses internal whitespace to single spaces
     - Ensures consistent formatting
     
+    Results for inputs up to 1 KiB are memoized, since raw datasets repeat
+    short lines often.
+    
     Args:
         text: The text to normalize
         
     Returns:
         Normalized text with consistent whitespace
     """
-    # Strip leading/trailing whitespace
-    text = text.strip()
-    
-    # Collapse internal whitespace to single spaces
-    text = " ".join(text.split())
-    
-    return text
+    if len(text) > _MAX_CACHED_LENGTH:
+        return _normalize_text_uncached(text)
+    return _normalize_text_cached(text)
@@ -50,6 +50,19 @@ class AggregationTests(unittest.TestCase):
             UNKNOWN_SEVERITY_WEIGHT,
         )
 
+    def test_mixed_result_shapes_are_counted(self):
+        class Finding:
+            severity = "High"
+
+        results = iter([{"severity": "low"}, "medium", Finding(), {}, ""])
+
+        aggregated = aggregate_validator_results(results)
+
+        self.assertEqual(aggregated["severity_counts"]["low"], 1)
+        self.assertEqual(aggregated["severity_counts"]["medium"], 1)
+        self.assertEqual(aggregated["severity_counts"]["high"], 1)
+        self.assertEqual(aggregated["severity_counts"]["unknown"], 2)
+
     def test_multiple_critical_results_clamp_to_unsafe(self):
         aggregated = aggregate_validator_results(["critical"] * 5)
 
@@ -0,0 +1,58 @@
+import unittest
+from unittest import mock
+
+from extraction import classifier
+from extraction.classifier import detect_mode, detect_modes
+
+
+SAMPLES = {
+    "Hello, can you help me understand neural networks?": "instruction",
+    "Please explain how backpropagation works.": "instruction",
+    "I feel excited about learning AI and machine learning.": "emotion",
+    "Once upon a time, there was a small model that learned to predict words.": "narrative",
+    "Because neural networks use gradients, they can learn complex patterns.": "reasoning",
+    "Thank you for your help!": "conversation",
+    "This conversation is really helping me understand the concepts better.": "meta",
+    "The weather is grey.": "other",
+}
+
+
+class ClassifierTests(unittest.TestCase):
+    def test_detects_documented_modes(self):
+        for text, expected in SAMPLES.items():
+            with self.subTest(text=text):
+                self.assertEqual(detect_mode(text), expected)
+
+    def test_higher_priority_group_wins_regardless_of_position(self):
+        self.assertEqual(detect_mode("Thanks, I love it because it works"), "reasoning")
+        self.assertEqual(detect_mode("I felt sad, tell me a story"), "instruction")
+
+    def test_precomputed_lowercase_is_used(self):
+        text = "Because it WORKS"
+        self.assertEqual(detect_mode(text, text.lower()), "reasoning")
+        self.assertEqual(detect_mode("unrelated", "thank you"), "conversation")
+
+    def test_detect_modes_matches_per_text_detection(self):
+        texts = list(SAMPLES)
+        self.assertEqual(detect_modes(texts), [detect_mode(t) for t in texts])
+        self.assertEqual(detect_modes([]), [])
+
+    def test_fallback_scan_matches_automaton(self):
+        classifier._detect_mode_cached.cache_clear()
+        self.addCleanup(classifier._detect_mode_cached.cache_clear)
+        with mock.patch.object(classifier, "_AUTOMATON", None):
+            for text, expected in SAMPLES.items():
+                with self.subTest(text=text):
+                    self.assertEqual(detect_mode(text), expected)
+
+    def test_long_texts_bypass_cache(self):
+        classifier._detect_mode_cached.cache_clear()
+        long_text = "because " * 100
+        self.assertEqual(detect_mode(long_text), "reasoning")
+        self.assertEqual(classifier._detect_mode_cached.cache_info().currsize, 0)
+        self.assertEqual(detect_mode("thanks"), "conversation")
+        self.assertEqual(classifier._detect_mode_cached.cache_info().currsize, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
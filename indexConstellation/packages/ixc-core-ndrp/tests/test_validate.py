@@ -0,0 +1,44 @@
+import unittest
+from unittest import mock
+
+from validator import validate
+
+
+VALID_ENTRY = {
+    "role": "user",
+    "content": "Example content",
+    "intent": "instruction",
+    "mode": "instruction",
+    "context": "Example context",
+    "reasoning_expanded": None,
+    "metadata": {"source_id": "demo", "lfsl_enabled": False},
+    "meaning_preserved": True,
+    "density_goal": "medium",
+    "entropy_class": "low",
+}
+
+
+class ValidateEntryTests(unittest.TestCase):
+    def test_valid_entry_has_no_errors(self):
+        self.assertEqual(validate.validate_entry(dict(VALID_ENTRY), 1), [])
+
+    def test_schema_error_is_reported(self):
+        entry = dict(VALID_ENTRY)
+        del entry["intent"]
+        errors = validate.validate_entry(entry, 3)
+        self.assertEqual(errors, ["[Entry 3] SCHEMA ERROR: 'intent' is a required property"])
+
+    @unittest.skipIf(validate.fastjsonschema is None, "fastjsonschema not installed")
+    def test_fast_rejection_is_kept_when_jsonschema_finds_nothing(self):
+        def reject(entry):
+            raise validate.fastjsonschema.JsonSchemaValueException("data must be rejected")
+
+        with mock.patch.object(validate, "_FAST_VALIDATE", reject), \
+                mock.patch("jsonschema.exceptions.best_match", return_value=None):
+            errors = validate.validate_entry(dict(VALID_ENTRY), 1)
+
+        self.assertEqual(errors, ["[Entry 1] SCHEMA ERROR: data must be rejected"])
+
+
+if __name__ == "__main__":
+    unittest.main()
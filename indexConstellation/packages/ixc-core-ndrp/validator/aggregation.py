@@ -7,8 +7,9 @@ single pure function, ``aggregate_validator_results``, which accepts an
 iterable of validator outputs and returns an explainable score, rating, and
 severity counts.
 """
-from collections import Counter, defaultdict
-from typing import Any, Iterable, Mapping, MutableMapping, Optional
+from collections import Counter
+from itertools import chain
+from typing import Any, Callable, Iterable, Mapping, MutableMapping, Optional
 
 # Default weights used to penalize findings by severity.
 DEFAULT_SEVERITY_WEIGHTS: Mapping[str, int] = {
@@ -25,6 +26,8 @@ UNKNOWN_SEVERITY_WEIGHT = 3
 
 MAX_SCORE = 100
 
+_NO_RESULT = object()
+
 
 def _extract_severity(result: Any) -> str:
     """
@@ -50,6 +53,35 @@ def _extract_severity(result: Any) -> str:
     return (severity_value or "unknown").lower()
 
 
+def _extract_severity_from_dict(result: Any) -> str:
+    """
+    ``_extract_severity`` specialized for plain dict results.
+    """
+    if type(result) is not dict:
+        return _extract_severity(result)
+    if "severity" in result:
+        return (str(result["severity"]) or "unknown").lower()
+    return "unknown"
+
+
+def _extract_severity_from_str(result: Any) -> str:
+    """
+    ``_extract_severity`` specialized for bare string results.
+    """
+    if type(result) is not str:
+        return _extract_severity(result)
+    return (result or "unknown").lower()
+
+
+# Specialized extractors for the common homogeneous result streams. Each one
+# re-checks the exact type and defers to _extract_severity otherwise, so a
+# mixed stream is still handled correctly.
+_SEVERITY_EXTRACTORS: Mapping[type, Callable[[Any], str]] = {
+    dict: _extract_severity_from_dict,
+    str: _extract_severity_from_str,
+}
+
+
 def _rating_from_score(score: int) -> str:
     """
     Convert a hygiene score into a qualitative rating.
@@ -123,20 +155,26 @@ def aggregate_validator_results(
     if severity_weights:
         weights.update(severity_weights)
 
-    severity_counts: Counter[str] = Counter()
-    penalty_by_severity: MutableMapping[str, int] = defaultdict(
-        int, {severity: 0 for severity in weights}
-    )
+    # Count labels in one C-level pass, then weight each distinct severity
+    # once rather than once per result.
+    # Results are almost always homogeneous, so the first one picks the
+    # extractor for the whole stream.
+    results = iter(results)
+    first = next(results, _NO_RESULT)
+    if first is _NO_RESULT:
+        severity_counts: Counter[str] = Counter()
+    else:
+        extract = _SEVERITY_EXTRACTORS.get(type(first), _extract_severity)
+        severity_counts = Counter(map(extract, chain((first,), results)))
+    penalty_by_severity: MutableMapping[str, int] = {severity: 0 for severity in weights}
 
     total_penalty = 0
 
-    for result in results:
-        severity = _extract_severity(result)
-        weight = weights.get(severity, UNKNOWN_SEVERITY_WEIGHT)
+    for severity, count in severity_counts.items():
+        penalty = count * weights.get(severity, UNKNOWN_SEVERITY_WEIGHT)
 
-        severity_counts[severity] += 1
-        penalty_by_severity[severity] += weight
-        total_penalty += weight
+        penalty_by_severity[severity] = penalty
+        total_penalty += penalty
 
     hygiene_score = max(0, MAX_SCORE - total_penalty)
     rating = _rating_from_score(hygiene_score)
@@ -1,8 +1,20 @@
 import json
 import math
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 import sys
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional accelerator; see the "fast" extra
+    _json_loads = json.loads
+
+# Lines check_file parses, measures and reports at a time.
+CHECK_CHUNK_LINES = 10000
+
 
 def shannon_entropy(text: str) -> float:
     """
@@ -11,21 +23,40 @@ def shannon_entropy(text: str) -> float:
     if not text:
         return 0.0
 
-    # Frequency of each character
-    freq = {}
-    for c in text:
-        freq[c] = freq.get(c, 0) + 1
+    # Frequency of each character, counted in C by Counter rather than
+    # one dict update per character in Python
+    freq = Counter(text)
 
     total = len(text)
     entropy = 0.0
+    log2 = math.log2
 
     for count in freq.values():
         p = count / total
-        entropy -= p * math.log2(p)
+        entropy -= p * log2(p)
 
     return entropy
 
 
+def shannon_entropies(texts, workers=1, executor=None):
+    """
+    Calculates Shannon entropy for many strings at once.
+    Returns a list of entropies in input order; with workers > 1 the
+    texts are spread across that many processes, in executor if given
+    (a ProcessPoolExecutor of that many workers, reused across calls).
+    """
+    texts = list(texts)
+
+    if workers <= 1 or len(texts) < 2:
+        return list(map(shannon_entropy, texts))
+
+    chunksize = max(1, len(texts) // (workers * 4))
+    if executor is not None:
+        return list(executor.map(shannon_entropy, texts, chunksize=chunksize))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(shannon_entropy, texts, chunksize=chunksize))
+
+
 def classify_entropy(entropy_value: float) -> str:
     """
     Maps numeric entropy to low/medium/high classes.
@@ -39,10 +70,16 @@ def classify_entropy(entropy_value: float) -> str:
         return "high"
 
 
-def check_file(jsonl_path):
+def check_file(jsonl_path, workers=1):
     """
     Computes entropy for each dataset entry and compares
     against its declared 'entropy_class'.
+
+    The file is read in chunks of CHECK_CHUNK_LINES lines: each chunk is
+    parsed, its entropies computed in one batch (optionally across
+    ``workers`` processes, one pool for the whole file) and its report
+    written before the next chunk is read, so memory stays bounded
+    whatever the file size.
     """
     jsonl_path = Path(jsonl_path)
 
@@ -55,27 +92,19 @@ def check_file(jsonl_path):
     total = 0
     mismatches = 0
 
-    with open(jsonl_path, "r", encoding="utf-8") as f:
-        for i, line in enumerate(f, start=1):
-            total += 1
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                print(f"[Entry {i}] JSON ERROR: Could not parse line.")
-                continue
-
-            content = entry.get("content", "")
-            measured_entropy = shannon_entropy(content)
-            measured_class = classify_entropy(measured_entropy)
-            declared_class = entry.get("entropy_class", "undefined")
-
-            if measured_class != declared_class:
-                mismatches += 1
-                print(
-                    f"[Entry {i}] ENTROPY MISMATCH → "
-                    f"declared: {declared_class} | measured: {measured_class} "
-                    f"(entropy={measured_entropy:.2f})"
-                )
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    try:
+        with open(jsonl_path, "rb") as f:
+            while True:
+                lines = list(islice(f, CHECK_CHUNK_LINES))
+                if not lines:
+                    break
+                mismatches += _check_chunk(lines, total + 1, workers, executor)
+                total += len(lines)
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     print("\n--- SUMMARY ---")
     print(f"Total entries: {total}")
@@ -83,10 +112,54 @@ def check_file(jsonl_path):
     print(f"Match rate: {((total - mismatches) / total) * 100:.2f}%")
 
 
+def _check_chunk(lines, first_index, workers, executor=None):
+    """Check one chunk of lines, write its report and return its mismatches."""
+    # None marks a line that is not valid JSON
+    entries = []
+    for line in lines:
+        try:
+            entries.append(_json_loads(line))
+        except json.JSONDecodeError:
+            entries.append(None)
+
+    entropies = iter(shannon_entropies(
+        (entry.get("content", "") for entry in entries if entry is not None),
+        workers=workers,
+        executor=executor,
+    ))
+
+    # Report lines are collected and written once per chunk rather than
+    # printed one at a time
+    out = []
+    mismatches = 0
+
+    for i, entry in enumerate(entries, start=first_index):
+        if entry is None:
+            out.append(f"[Entry {i}] JSON ERROR: Could not parse line.\n")
+            continue
+
+        measured_entropy = next(entropies)
+        measured_class = classify_entropy(measured_entropy)
+        declared_class = entry.get("entropy_class", "undefined")
+
+        if measured_class != declared_class:
+            mismatches += 1
+            out.append(
+                f"[Entry {i}] ENTROPY MISMATCH → "
+                f"declared: {declared_class} | measured: {measured_class} "
+                f"(entropy={measured_entropy:.2f})\n"
+            )
+
+    sys.stdout.write("".join(out))
+    return mismatches
+
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python entropy_check.py <dataset.jsonl>")
+    workers = sys.argv[2] if len(sys.argv) > 2 else "1"
+
+    if len(sys.argv) < 2 or not workers.isdecimal() or int(workers) < 1:
+        print("Usage: python entropy_check.py <dataset.jsonl> [workers]")
+        print("  workers: processes to use, a positive integer (default 1)")
         sys.exit(1)
 
-    check_file(sys.argv[1])
+    check_file(sys.argv[1], workers=int(workers))
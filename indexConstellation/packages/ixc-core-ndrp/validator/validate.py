@@ -1,15 +1,77 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
 import json
-import jsonschema
-from jsonschema import validate
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # optional accelerator; see the "fast" extra
+    _json_loads = json.loads
+
+try:
+    import fastjsonschema
+except ImportError:  # optional accelerator; see the "fast" extra
+    fastjsonschema = None
+
+# Lines validate_file reads and validates at a time; with workers > 1 this
+# is the unit of work handed to each process.
+VALIDATE_CHUNK_SIZE = 10000
+
 # Load entry schema
 SCHEMA_PATH = Path(__file__).parent.parent / "schema" / "entry_schema.json"
 
 with open(SCHEMA_PATH, "r") as f:
     ENTRY_SCHEMA = json.load(f)
 
+_FAST_VALIDATE = fastjsonschema.compile(ENTRY_SCHEMA) if fastjsonschema is not None else None
+
+
+@lru_cache(maxsize=None)
+def _schema_validator():
+    """
+    Check ENTRY_SCHEMA and build its jsonschema validator, once.
+
+    jsonschema is imported here rather than at module load: it is slow to
+    import, and when fastjsonschema is installed it is only needed to word
+    the error for an entry that fails, so clean files never load it.
+    """
+    import jsonschema
+
+    validator_cls = jsonschema.validators.validator_for(ENTRY_SCHEMA)
+    validator_cls.check_schema(ENTRY_SCHEMA)
+    return validator_cls(ENTRY_SCHEMA)
+
+
+def _schema_error(entry):
+    """
+    Return the schema error message for ``entry``, or None if it conforms
+    to ENTRY_SCHEMA.
+
+    Messages are worded by jsonschema; if jsonschema finds nothing to
+    report for an entry fastjsonschema rejected, fastjsonschema's own
+    message is used rather than letting the entry pass.
+    """
+    fast_error = None
+    if _FAST_VALIDATE is not None:
+        try:
+            _FAST_VALIDATE(entry)
+            return None
+        except fastjsonschema.JsonSchemaException as e:
+            fast_error = e
+
+    from jsonschema.exceptions import best_match
+
+    error = best_match(_schema_validator().iter_errors(entry))
+    if error is not None:
+        return error.message
+    if fast_error is not None:
+        return getattr(fast_error, "message", None) or str(fast_error)
+    return None
+
 
 def validate_entry(entry, index):
     """
@@ -18,15 +80,17 @@ def validate_entry(entry, index):
     """
     errors = []
 
-    try:
-        validate(instance=entry, schema=ENTRY_SCHEMA)
-    except jsonschema.exceptions.ValidationError as e:
-        errors.append(f"[Entry {index}] SCHEMA ERROR: {e.message}")
+    error = _schema_error(entry)
+    if error is not None:
+        errors.append(f"[Entry {index}] SCHEMA ERROR: {error}")
 
-    # Additional checks beyond JSON Schema:
+    # Additional checks beyond JSON Schema, on fields read once up front:
+    meaning_preserved = entry.get("meaning_preserved")
+    content = entry.get("content")
+    role = entry.get("role")
 
     # 1. Meaning preservation field should match boolean type
-    if not isinstance(entry.get("meaning_preserved"), bool):
+    if not isinstance(meaning_preserved, bool):
         errors.append(f"[Entry {index}] meaning_preserved must be true or false")
 
     # 2. Density & entropy must be coherent
@@ -34,20 +98,84 @@ def validate_entry(entry, index):
         errors.append(f"[Entry {index}] High density cannot coexist with high entropy")
 
     # 3. Content must not be empty
-    if not entry.get("content") or entry["content"].strip() == "":
+    if not content or content.strip() == "":
         errors.append(f"[Entry {index}] Content is empty")
 
     # 4. Role must be valid
-    if entry.get("role") not in ["user", "assistant", "system"]:
-        errors.append(f"[Entry {index}] Invalid role: {entry.get('role')}")
+    if role not in ("user", "assistant", "system"):
+        errors.append(f"[Entry {index}] Invalid role: {role}")
 
     return errors
 
 
-def validate_file(jsonl_path):
+def _validate_lines(lines, start):
+    """
+    Validates consecutive .jsonl lines, the first being entry ``start``.
+    Returns (total, valid, errors_found, messages) with the messages in line
+    order.
+    """
+    valid = 0
+    errors_found = 0
+    messages = []
+
+    for i, line in enumerate(lines, start=start):
+        try:
+            entry = _json_loads(line)
+        except json.JSONDecodeError:
+            messages.append(f"[Entry {i}] JSON ERROR: Invalid JSON line.")
+            errors_found += 1
+            continue
+
+        errors = validate_entry(entry, i)
+
+        if errors:
+            errors_found += len(errors)
+            messages.extend(errors)
+        else:
+            valid += 1
+
+    return len(lines), valid, errors_found, messages
+
+
+def _line_chunks(f):
+    """
+    Yields (lines, start) for consecutive ``VALIDATE_CHUNK_SIZE``-line
+    chunks of ``f``, where ``start`` is the entry number of the first line.
+    """
+    start = 1
+    while True:
+        chunk = list(islice(f, VALIDATE_CHUNK_SIZE))
+        if not chunk:
+            return
+        yield chunk, start
+        start += len(chunk)
+
+
+def _validate_in_workers(f, workers):
+    """
+    Runs ``_validate_lines`` over the chunks of ``f`` on a process pool,
+    yielding results in file order. At most two chunks per worker are in
+    flight, bounding memory on large files.
+    """
+    chunks = _line_chunks(f)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        while True:
+            for chunk, start in islice(chunks, workers * 2 - len(pending)):
+                pending.append(executor.submit(_validate_lines, chunk, start))
+            if not pending:
+                break
+            yield pending.popleft().result()
+
+
+def validate_file(jsonl_path, workers=1):
     """
     Validates all entries in a .jsonl dataset file.
     Returns the number of errors found.
+
+    With workers > 1 the file is validated in chunks across that many
+    processes; the report is identical to a serial run.
     """
     jsonl_path = Path(jsonl_path)
 
@@ -61,24 +189,18 @@ def validate_file(jsonl_path):
     valid = 0
     errors_found = 0
 
-    with open(jsonl_path, "r", encoding="utf-8") as f:
-        for i, line in enumerate(f, start=1):
-            total += 1
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                print(f"[Entry {i}] JSON ERROR: Invalid JSON line.")
-                errors_found += 1
-                continue
-
-            errors = validate_entry(entry, i)
-
-            if errors:
-                errors_found += len(errors)
-                for err in errors:
-                    print(err)
-            else:
-                valid += 1
+    with open(jsonl_path, "rb") as f:
+        if workers > 1:
+            results = _validate_in_workers(f, workers)
+        else:
+            results = (_validate_lines(chunk, start) for chunk, start in _line_chunks(f))
+
+        for chunk_total, chunk_valid, chunk_errors, messages in results:
+            total += chunk_total
+            valid += chunk_valid
+            errors_found += chunk_errors
+            for message in messages:
+                print(message)
 
     print("\n--- SUMMARY ---")
     print(f"Total entries: {total}")
@@ -89,11 +211,14 @@ def validate_file(jsonl_path):
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python validate.py <dataset.jsonl>")
+    workers = sys.argv[2] if len(sys.argv) > 2 else "1"
+
+    if len(sys.argv) < 2 or not workers.isdecimal() or int(workers) < 1:
+        print("Usage: python validate.py <dataset.jsonl> [workers]")
+        print("  workers: processes to use, a positive integer (default 1)")
         sys.exit(1)
 
-    error_count = validate_file(sys.argv[1])
+    error_count = validate_file(sys.argv[1], workers=int(workers))
     
     # Return appropriate exit code based on validation results
     sys.exit(0 if error_count == 0 else 1)
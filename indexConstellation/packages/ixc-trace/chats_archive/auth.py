@@ -6,11 +6,19 @@ Never stores tokens in plaintext files or environment variables in code.
 import os
 import hashlib
 import sys
-from typing import Optional
+import time
+from typing import Dict, Optional, Tuple
 from datetime import datetime
 import json
 
 
+# Seconds a token read from the credential store is reused in-process
+TOKEN_CACHE_TTL_SECONDS = 300
+
+# (service, key) -> (monotonic time read, token)
+_token_cache: Dict[Tuple[str, str], Tuple[float, str]] = {}
+
+
 class TokenManager:
     """
     Manages ChatGPT session bearer tokens securely.
@@ -58,6 +66,7 @@ class TokenManager:
             return False
         
         try:
+            self._invalidate_cache()
             if self._keyring:
                 self._keyring.set_password(self.SERVICE_NAME, self.TOKEN_KEY, token)
                 print(f"✅ Token stored securely in {self.platform} credential manager")
@@ -86,11 +95,21 @@ class TokenManager:
         return response in ('y', 'yes')
     
     def retrieve_token(self) -> Optional[str]:
-        """Retrieve auth token from OS credential manager."""
+        """
+        Retrieve auth token from OS credential manager.
+        
+        Tokens found in the credential store are reused for
+        TOKEN_CACHE_TTL_SECONDS, sparing a keyring roundtrip per call.
+        """
         try:
             if self._keyring:
+                cache_key = (self.SERVICE_NAME, self.TOKEN_KEY)
+                cached = _token_cache.get(cache_key)
+                if cached and time.monotonic() - cached[0] < TOKEN_CACHE_TTL_SECONDS:
+                    return cached[1]
                 token = self._keyring.get_password(self.SERVICE_NAME, self.TOKEN_KEY)
                 if token:
+                    _token_cache[cache_key] = (time.monotonic(), token)
                     return token
             token = os.getenv('CHATGPT_AUTH_TOKEN')
             if token:
@@ -105,6 +124,7 @@ class TokenManager:
     def delete_token(self) -> bool:
         """Delete stored auth token"""
         try:
+            self._invalidate_cache()
             if self._keyring:
                 self._keyring.delete_password(self.SERVICE_NAME, self.TOKEN_KEY)
                 print("✅ Token deleted from credential manager")
@@ -116,6 +136,10 @@ class TokenManager:
             print(f"❌ Failed to delete token: {e}")
             return False
     
+    def _invalidate_cache(self):
+        """Forget any cached token so the next retrieve reads the store."""
+        _token_cache.pop((self.SERVICE_NAME, self.TOKEN_KEY), None)
+    
     def validate_token(self, token: str) -> bool:
         """
         Basic validation of token format.
@@ -21,14 +21,38 @@ Commands:
 import sys
 import argparse
 import json
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 
 from chats_archive.auth import TokenManager, ProtectedLogger
 from chats_archive.orchestrator import ArchiveOrchestrator
 from chats_archive.storage import LocalEncryptedStore, EncryptionKeyManager
 from chats_archive.fetcher import ConversationFetcher, APIStatus
 from chats_archive.importer import ManualImporter
+from chats_archive.index import MetadataIndex
+
+# Characters replaced with "_" in Markdown file names: anything that is not
+# alphanumeric (str.isalnum, so Unicode letters are kept), a space, "-" or "_"
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]")
+
+# Markdown exports queued per worker process with --workers; bounds the
+# futures (and results) alive at once on large archives
+EXPORT_IN_FLIGHT_PER_WORKER = 4
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def auth_setup(args):
@@ -78,12 +102,16 @@ def export(args):
         orchestrator = ArchiveOrchestrator(
             token_manager=token_manager,
             archive_dir=args.archive_dir,
-            logger=logger
-        )
-        job_id = orchestrator.run_export(
-            resume_job_id=args.resume,
-            force_refetch=args.force_refetch
+            logger=logger,
+            detail_concurrency=args.concurrency
         )
+        try:
+            job_id = orchestrator.run_export(
+                resume_job_id=args.resume,
+                force_refetch=args.force_refetch
+            )
+        finally:
+            orchestrator.close()
         print(f"\n✅ Export job completed: {job_id}")
         return 0
     except Exception as e:
@@ -96,7 +124,10 @@ def import_json(args):
     try:
         store = LocalEncryptedStore(args.archive_dir)
         importer = ManualImporter(store)
-        count = importer.import_from_file(args.file)
+        if args.ndjson:
+            count = importer.import_from_ndjson(args.file)
+        else:
+            count = importer.import_from_file(args.file, stream=args.stream)
         if count > 0:
             print(f"✅ Imported {count} conversations")
         else:
@@ -118,21 +149,17 @@ def list_conversations(args):
     
     conversations = []
     
-    for date_dir in sorted(archive_path.iterdir(), reverse=True):
-        if not date_dir.is_dir():
+    for date_dir, filepath, metadata in MetadataIndex(store).entries():
+        if metadata is None:
+            continue
+        try:
+            conversations.append({
+                "id": metadata.get("id", filepath.stem.replace("conv-", ""))[:8],
+                "title": metadata.get("title", "Untitled"),
+                "date": date_dir.name
+            })
+        except Exception:
             continue
-        for filepath in date_dir.glob("conv-*.enc"):
-            try:
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                metadata = data.get("metadata", {})
-                conversations.append({
-                    "id": metadata.get("id", filepath.stem.replace("conv-", ""))[:8],
-                    "title": metadata.get("title", "Untitled"),
-                    "date": date_dir.name
-                })
-            except Exception:
-                continue
     
     if not conversations:
         print("No archived conversations found.")
@@ -148,6 +175,44 @@ def list_conversations(args):
     return 0
 
 
+def _iter_conversation_messages(mapping: dict, root_id: str):
+    """
+    Yield (role, text) for every message with non-blank text, walking the
+    conversation tree depth-first from root_id in conversation order.
+    
+    Uses an explicit stack rather than recursion, so long linear chats do
+    not hit the recursion limit; a node reached twice (a malformed, cyclic
+    mapping) is not walked again.
+    """
+    stack = [root_id]
+    seen = set()
+    
+    while stack:
+        node_id = stack.pop()
+        if node_id in seen:
+            continue
+        seen.add(node_id)
+        
+        node = mapping.get(node_id, {})
+        msg = node.get("message")
+        
+        if msg and msg.get("content"):
+            role = msg.get("author", {}).get("role", "unknown")
+            parts = msg.get("content", {}).get("parts", [])
+            # parts decoded from JSON are almost always all strings; only
+            # mixed lists need the filtering pass
+            try:
+                text = "".join(parts)
+            except TypeError:
+                text = "".join(str(p) for p in parts if isinstance(p, str))
+            
+            if text.strip():
+                yield role, text
+        
+        # Reversed so the first child is popped, and walked, first
+        stack.extend(reversed(node.get("children", [])))
+
+
 def read_conversation(args):
     """Decrypt and display a conversation (fails closed if integrity is not VALID)."""
     store = LocalEncryptedStore(args.archive_dir)
@@ -179,33 +244,61 @@ def read_conversation(args):
             root_id = node_id
             break
     
-    def walk(node_id):
-        node = mapping.get(node_id, {})
-        msg = node.get("message")
-        
-        if msg and msg.get("content"):
-            role = msg.get("author", {}).get("role", "unknown")
-            parts = msg.get("content", {}).get("parts", [])
-            text = "".join(str(p) for p in parts if isinstance(p, str))
-            
-            if text.strip():
-                if role == "user":
-                    print(f"**User:**\n{text}\n")
-                elif role == "assistant":
-                    print(f"**Assistant:**\n{text}\n")
-                print("---\n")
-        
-        for child_id in node.get("children", []):
-            walk(child_id)
-    
     if root_id:
-        walk(root_id)
+        for role, text in _iter_conversation_messages(mapping, root_id):
+            if role == "user":
+                print(f"**User:**\n{text}\n")
+            elif role == "assistant":
+                print(f"**Assistant:**\n{text}\n")
+            print("---\n")
     else:
         print("(Could not parse conversation structure)")
     
     return 0
 
 
+def _export_markdown_one(store: LocalEncryptedStore, output_dir: Path, date_name: str, md_meta) -> bool:
+    """
+    Verify, decrypt and render one archived conversation into output_dir.
+    
+    Returns True if a Markdown file was written and False if the
+    conversation is not VALID or could not be loaded; other errors raise.
+    """
+    if not isinstance(md_meta, dict):
+        md_meta = {}
+    conv_id = md_meta.get("id") or md_meta.get("conversation_id") or "unknown"
+
+    # retrieve_conversation verifies the checksum itself and returns None
+    # unless the conversation is VALID, so the wrapper is read and
+    # decrypted once.
+    conv = store.retrieve_conversation(conv_id)
+    if not conv:
+        return False
+    
+    md = format_conversation_markdown(conv)
+    
+    title = conv.get("title", "untitled")[:50]
+    safe_title = _UNSAFE_FILENAME_CHARS.sub("_", title)
+    safe_title = safe_title.strip().replace(" ", "_")
+    
+    out_file = output_dir / f"{date_name}_{safe_title}_{conv_id[:8]}.md"
+    out_file.write_text(md, encoding="utf-8")
+    return True
+
+
+# Store opened once per export-markdown worker process
+_worker_store: Optional[LocalEncryptedStore] = None
+
+
+def _init_export_worker(archive_dir: str):
+    global _worker_store
+    _worker_store = LocalEncryptedStore(archive_dir)
+
+
+def _export_markdown_in_worker(output_dir: Path, date_name: str, md_meta) -> bool:
+    return _export_markdown_one(_worker_store, output_dir, date_name, md_meta)
+
+
 def export_markdown(args):
     """Export all conversations to Markdown files."""
     store = LocalEncryptedStore(args.archive_dir)
@@ -221,40 +314,48 @@ def export_markdown(args):
     exported = 0
     failed = 0
     
-    for date_dir in archive_path.iterdir():
-        if not date_dir.is_dir():
-            continue
-        for filepath in date_dir.glob("conv-*.enc"):
+    entries = MetadataIndex(store).entries()
+    workers = args.workers
+    
+    if workers > 1:
+        # Decryption and rendering are CPU-bound; each worker process opens
+        # its own store and the results are tallied in archive order.
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_export_worker,
+            initargs=(args.archive_dir,)
+        )
+        max_in_flight = workers * EXPORT_IN_FLIGHT_PER_WORKER
+        pending = deque()
+        
+        def collect_oldest():
+            nonlocal exported, failed
+            filepath, future = pending.popleft()
             try:
-                wrapper = None
-                try:
-                    with open(filepath, "r") as f:
-                        wrapper = json.load(f)
-                except Exception:
-                    wrapper = None
-
-                md_meta = wrapper.get("metadata", {}) if isinstance(wrapper, dict) else {}
-                conv_id = md_meta.get("id") or md_meta.get("conversation_id") or "unknown"
-                integrity = store.verify_conversation(conv_id)
-                if integrity.state.value != 'valid':
+                if future.result():
+                    exported += 1
+                else:
                     failed += 1
-                    continue
-
-                conv = store.retrieve_conversation(conv_id)
-                if not conv:
+            except Exception as e:
+                print(f"  ✗ {filepath.name}: {e}")
+                failed += 1
+        
+        with executor:
+            for date_dir, filepath, md_meta in entries:
+                if len(pending) >= max_in_flight:
+                    collect_oldest()
+                pending.append(
+                    (filepath, executor.submit(_export_markdown_in_worker, output_dir, date_dir.name, md_meta))
+                )
+            while pending:
+                collect_oldest()
+    else:
+        for date_dir, filepath, md_meta in entries:
+            try:
+                if _export_markdown_one(store, output_dir, date_dir.name, md_meta):
+                    exported += 1
+                else:
                     failed += 1
-                    continue
-                
-                md = format_conversation_markdown(conv)
-                
-                title = conv.get("title", "untitled")[:50]
-                safe_title = "".join(c if c.isalnum() or c in " -_" else "_" for c in title)
-                safe_title = safe_title.strip().replace(" ", "_")
-                
-                out_file = output_dir / f"{date_dir.name}_{safe_title}_{conv_id[:8]}.md"
-                out_file.write_text(md, encoding="utf-8")
-                exported += 1
-                
             except Exception as e:
                 print(f"  ✗ {filepath.name}: {e}")
                 failed += 1
@@ -287,27 +388,13 @@ def format_conversation_markdown(conv: dict) -> str:
             root_id = node_id
             break
     
-    def walk(node_id):
-        node = mapping.get(node_id, {})
-        msg = node.get("message")
-        
-        if msg and msg.get("content"):
-            role = msg.get("author", {}).get("role", "unknown")
-            parts = msg.get("content", {}).get("parts", [])
-            text = "".join(str(p) for p in parts if isinstance(p, str))
-            
-            if text.strip():
-                if role == "user":
-                    lines.append(f"## User\n\n{text}\n")
-                elif role == "assistant":
-                    lines.append(f"## Assistant\n\n{text}\n")
-                lines.append("---\n")
-        
-        for child_id in node.get("children", []):
-            walk(child_id)
-    
     if root_id:
-        walk(root_id)
+        for role, text in _iter_conversation_messages(mapping, root_id):
+            if role == "user":
+                lines.append(f"## User\n\n{text}\n")
+            elif role == "assistant":
+                lines.append(f"## Assistant\n\n{text}\n")
+            lines.append("---\n")
     
     return "\n".join(lines)
 
@@ -418,10 +505,12 @@ def verify_api(args):
     
     base_url = "https://chatgpt.com/backend-api"
     
-    headers = {
+    # One session for both checks, so the second reuses the connection
+    session = requests.Session()
+    session.headers.update({
         "Authorization": f"Bearer {token}",
         "User-Agent": "chats-archive/1.0"
-    }
+    })
     
     print("🔍 Verifying API endpoints...\n")
     
@@ -430,10 +519,9 @@ def verify_api(args):
     # Test 1: List conversations
     print("1. Testing /conversations endpoint...")
     try:
-        resp = requests.get(
+        resp = session.get(
             f"{base_url}/conversations",
             params={"limit": 1},
-            headers=headers,
             timeout=10
         )
         results.append({
@@ -451,9 +539,8 @@ def verify_api(args):
                 conv_id = items[0].get("id")
                 print(f"\n2. Testing /conversation/{{id}} endpoint...")
                 
-                resp2 = requests.get(
+                resp2 = session.get(
                     f"{base_url}/conversation/{conv_id}",
-                    headers=headers,
                     timeout=10
                 )
                 results.append({
@@ -481,6 +568,8 @@ def verify_api(args):
     except Exception as e:
         print(f"   ❌ Error: {e}")
         results.append({"endpoint": "/conversations", "status": "ERROR", "ok": False})
+    finally:
+        session.close()
     
     print("\n" + "=" * 50)
     print("VERIFICATION SUMMARY")
@@ -611,11 +700,18 @@ Commands:
     p.add_argument("--archive-dir", default="~/.chats_archive")
     p.add_argument("--resume", help="Resume a previous export job")
     p.add_argument("--force-refetch", action="store_true")
+    p.add_argument("--concurrency", type=_positive_int, default=None,
+                   help="Conversation details fetched in parallel (default 4)")
     p.set_defaults(func=export)
     
     # import-json
     p = subparsers.add_parser("import-json", help="Import from ChatGPT export JSON")
     p.add_argument("--file", "-f", required=True)
+    p.add_argument("--ndjson", action="store_true",
+                   help="File holds one conversation per line (NDJSON)")
+    p.add_argument("--stream", action="store_true",
+                   help="Stream the export with ijson to bound memory; a damaged "
+                        "file keeps the conversations stored before the damage")
     p.add_argument("--archive-dir", default="~/.chats_archive")
     p.set_defaults(func=import_json)
     
@@ -634,6 +730,8 @@ Commands:
     p = subparsers.add_parser("export-markdown", help="Export all to Markdown")
     p.add_argument("--output", "-o", default="~/chats_export")
     p.add_argument("--archive-dir", default="~/.chats_archive")
+    p.add_argument("--workers", type=int, default=1,
+                   help="Worker processes for decryption and rendering")
     p.set_defaults(func=export_markdown)
     
     # key-export
@@ -5,12 +5,18 @@ Only makes requests to chatgpt.com backend-api (no other external services).
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import random
+import threading
 import time
-from typing import List, Dict, Any, Optional, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from datetime import datetime
-import json
 from enum import Enum
 
+from chats_archive.storage import json_loads
+
 
 class APIStatus(Enum):
     """API health status categories."""
@@ -21,6 +27,49 @@ class APIStatus(Enum):
     UNKNOWN = "unknown"
 
 
+class APIError(Exception):
+    """Unexpected HTTP status from the backend API."""
+    
+    def __init__(self, status_code: int):
+        super().__init__(f"API error: {status_code}")
+        self.status_code = status_code
+
+
+class DeprecatedAPIError(Exception):
+    """The backend API answered, but its response says it is deprecated."""
+
+
+_NO_ID = object()
+
+
+# Seconds a successful validate_token() result is reused for the same token
+TOKEN_VALIDATION_TTL_SECONDS = 60
+
+# token -> monotonic time it last validated
+_validated_tokens: Dict[str, float] = {}
+
+
+class _RateLimiter:
+    """
+    Spaces calls to acquire() at least min_interval seconds apart across
+    all threads sharing the limiter.
+    """
+    
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        
+        if slot > now:
+            time.sleep(slot - now)
+
+
 class ConversationFetcher:
     """
     Fetches conversations from ChatGPT backend-api endpoints.
@@ -32,23 +81,37 @@ class ConversationFetcher:
     
     DEFAULT_BATCH_SIZE = 100
     REQUEST_DELAY_SECONDS = 0.5
+    PREFETCH_BATCHES = 4
+    DETAIL_CONCURRENCY = 4
     MAX_RETRIES = 3
     INITIAL_BACKOFF_SECONDS = 2
+    BACKOFF_JITTER_SECONDS = 0.5
     
-    def __init__(self, auth_token: str, logger=None):
+    def __init__(self, auth_token: str, logger=None, detail_concurrency: Optional[int] = None):
         """
         Initialize fetcher with ChatGPT session bearer token.
         
         Args:
             auth_token: Valid ChatGPT session token (NOT an sk-* API key)
             logger: ProtectedLogger instance
+            detail_concurrency: Conversation details fetched at once by
+                fetch_conversation_details_bulk (default DETAIL_CONCURRENCY)
         """
         if not auth_token or len(auth_token) < 20:
             raise ValueError("Invalid auth token format")
+        if detail_concurrency is None:
+            detail_concurrency = self.DETAIL_CONCURRENCY
+        elif detail_concurrency < 1:
+            raise ValueError("detail_concurrency must be at least 1")
         
         self.auth_token = auth_token
         self.logger = logger
+        self.detail_concurrency = detail_concurrency
         self.session = requests.Session()
+        pool_size = max(self.PREFETCH_BATCHES, self.detail_concurrency)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self._rate_limiter = _RateLimiter(self.REQUEST_DELAY_SECONDS)
         self.session.headers.update({
             'Authorization': f'Bearer {auth_token}',
             'User-Agent': 'chats-archive/1.0'
@@ -61,65 +124,103 @@ class ConversationFetcher:
         try:
             response = self.session.get(test_url, timeout=10)
             
-            if response.status_code == 200:
-                if 'deprecated' in response.text.lower():
-                    return APIStatus.DEPRECATED, "API endpoint is deprecated"
-                return APIStatus.OK, "API responding normally"
-            elif response.status_code == 401:
-                return APIStatus.BLOCKED, "Authentication failed (token invalid/expired)"
-            elif response.status_code == 403:
-                return APIStatus.BLOCKED, "Access forbidden"
-            elif response.status_code == 429:
-                return APIStatus.OK, "API responding (rate limited)"
-            elif 500 <= response.status_code < 600:
-                return APIStatus.UNREACHABLE, f"Server error {response.status_code}"
-            else:
-                return APIStatus.UNKNOWN, f"Unexpected status {response.status_code}"
+            if response.status_code == 200 and 'deprecated' in response.text.lower():
+                return APIStatus.DEPRECATED, "API endpoint is deprecated"
+            return self._status_for_code(response.status_code)
                 
-        except requests.exceptions.ConnectionError:
+        except Exception as e:
+            return self._status_for_error(e)
+    
+    @staticmethod
+    def _status_for_code(status_code: int) -> Tuple[APIStatus, str]:
+        """Map an HTTP status from the conversations endpoint to an APIStatus."""
+        if status_code == 200:
+            return APIStatus.OK, "API responding normally"
+        elif status_code == 401:
+            return APIStatus.BLOCKED, "Authentication failed (token invalid/expired)"
+        elif status_code == 403:
+            return APIStatus.BLOCKED, "Access forbidden"
+        elif status_code == 429:
+            return APIStatus.OK, "API responding (rate limited)"
+        elif 500 <= status_code < 600:
+            return APIStatus.UNREACHABLE, f"Server error {status_code}"
+        else:
+            return APIStatus.UNKNOWN, f"Unexpected status {status_code}"
+    
+    def _status_for_error(self, error: Exception) -> Tuple[APIStatus, str]:
+        """Map an exception from a conversations request to an APIStatus."""
+        if isinstance(error, APIError):
+            return self._status_for_code(error.status_code)
+        elif isinstance(error, DeprecatedAPIError):
+            return APIStatus.DEPRECATED, "API endpoint is deprecated"
+        elif isinstance(error, PermissionError):
+            return self._status_for_code(401)
+        elif isinstance(error, requests.exceptions.ConnectionError):
             return APIStatus.UNREACHABLE, "Network connection failed"
-        except requests.exceptions.Timeout:
+        elif isinstance(error, requests.exceptions.Timeout):
             return APIStatus.UNREACHABLE, "Request timeout"
-        except Exception as e:
-            return APIStatus.UNKNOWN, str(e)
+        else:
+            return APIStatus.UNKNOWN, str(error)
     
     def fetch_all_conversations(self, limit: int = None, batch_size: int = None) -> Dict:
-        """Fetch all conversations for authenticated user."""
-        status, message = self.validate_api_status()
-        if status != APIStatus.OK:
-            raise RuntimeError(f"API not available: {status.value} - {message}")
+        """
+        Fetch all conversations for authenticated user.
         
+        The first page doubles as the API health check: if it fails, or
+        its body mentions deprecation, a RuntimeError naming the APIStatus
+        is raised, as validate_api_status would report it.
+        """
         batch_size = batch_size or self.DEFAULT_BATCH_SIZE
         all_conversations = []
         offset = 0
+        total_bytes = 0
         
         if self.logger:
             self.logger.log_event("fetch_started", {"batch_size": batch_size})
         
         start_time = time.time()
         
-        while True:
-            if limit and len(all_conversations) >= limit:
-                break
-            
-            batch, has_more = self._fetch_batch(offset, batch_size)
-            
-            if not batch:
-                break
-            
-            all_conversations.extend(batch)
-            offset += len(batch)
-            time.sleep(self.REQUEST_DELAY_SECONDS)
-            
-            if not has_more:
-                break
+        try:
+            batch, has_more, batch_bytes = self._fetch_batch(0, batch_size, check_deprecated=True)
+        except Exception as e:
+            status, message = self._status_for_error(e)
+            raise RuntimeError(f"API not available: {status.value} - {message}") from e
+        
+        all_conversations.extend(batch)
+        offset += len(batch)
+        total_bytes += batch_bytes
+        
+        # Once the first page is in, up to PREFETCH_BATCHES more are
+        # requested ahead, assuming each earlier page comes back full; pages
+        # are consumed in offset order, and the shared rate limiter keeps the
+        # overall request rate at one per REQUEST_DELAY_SECONDS.
+        next_offset = batch_size
+        pending = deque()
+        
+        with ThreadPoolExecutor(max_workers=self.PREFETCH_BATCHES) as executor:
+            try:
+                while batch and has_more:
+                    if limit and len(all_conversations) >= limit:
+                        break
+                    
+                    while len(pending) < self.PREFETCH_BATCHES and not (limit and next_offset >= limit):
+                        pending.append(executor.submit(self._fetch_batch, next_offset, batch_size))
+                        next_offset += batch_size
+                    
+                    batch, has_more, batch_bytes = pending.popleft().result()
+                    all_conversations.extend(batch)
+                    offset += len(batch)
+                    total_bytes += batch_bytes
+            finally:
+                for future in pending:
+                    future.cancel()
         
         duration = time.time() - start_time
         
         if self.logger:
             self.logger.log_fetch(
                 conversation_count=len(all_conversations),
-                bytes_downloaded=len(json.dumps(all_conversations).encode()),
+                bytes_downloaded=total_bytes,
                 duration_s=duration
             )
         
@@ -130,70 +231,162 @@ class ConversationFetcher:
             "limit": batch_size
         }
     
-    def _fetch_batch(self, offset: int = 0, limit: int = 100) -> Tuple[List[Dict], bool]:
-        """Fetch single batch of conversations."""
+    def _backoff_seconds(self, attempt: int, response=None) -> float:
+        """
+        Seconds to wait before retry number ``attempt`` + 1.
+        
+        Honors a numeric Retry-After header on ``response``, otherwise backs
+        off exponentially; random jitter keeps concurrent workers from
+        retrying in lockstep.
+        """
+        wait = self.INITIAL_BACKOFF_SECONDS * (2 ** attempt)
+        if response is not None:
+            try:
+                wait = max(0.0, float(response.headers["Retry-After"]))
+            except (KeyError, TypeError, ValueError):
+                pass
+        return wait + random.uniform(0, self.BACKOFF_JITTER_SECONDS)
+    
+    def _fetch_batch(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        check_deprecated: bool = False
+    ) -> Tuple[List[Dict], bool, int]:
+        """
+        Fetch single batch of conversations.
+        
+        Returns (conversations, has_more, bytes_downloaded). With
+        check_deprecated, a 200 response whose body mentions deprecation
+        raises DeprecatedAPIError, as validate_api_status checks.
+        """
         url = f"{self.BASE_URL}/conversations"
         params = {"offset": offset, "limit": limit}
         
+        self._rate_limiter.acquire()
+        
         for attempt in range(self.MAX_RETRIES):
             try:
                 response = self.session.get(url, params=params, timeout=10)
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    if check_deprecated and 'deprecated' in response.text.lower():
+                        raise DeprecatedAPIError("API endpoint is deprecated")
+                    data = json_loads(response.content)
                     conversations = data.get('items', [])
-                    return conversations, len(conversations) == limit
+                    return conversations, len(conversations) == limit, len(response.content)
                 elif response.status_code == 401:
                     raise PermissionError("Auth token invalid or expired")
                 elif response.status_code == 429:
-                    wait_time = self.INITIAL_BACKOFF_SECONDS * (2 ** attempt)
-                    print(f"⏳ Rate limited. Waiting {wait_time}s...")
+                    wait_time = self._backoff_seconds(attempt, response)
+                    print(f"⏳ Rate limited. Waiting {wait_time:.1f}s...")
                     time.sleep(wait_time)
                     continue
                 else:
-                    raise Exception(f"API error: {response.status_code}")
+                    raise APIError(response.status_code)
             
             except requests.exceptions.Timeout:
                 if attempt < self.MAX_RETRIES - 1:
-                    time.sleep(self.INITIAL_BACKOFF_SECONDS * (2 ** attempt))
+                    time.sleep(self._backoff_seconds(attempt))
                 else:
                     raise
         
-        return [], False
+        return [], False, 0
     
     def fetch_conversation_detail(self, conversation_id: str) -> Optional[Dict[str, Any]]:
-        """Fetch full conversation by ID."""
+        """
+        Fetch full conversation by ID.
+        
+        Paced by the same rate limiter as conversation list pages, so
+        concurrent detail fetches share its request rate.
+        """
         url = f"{self.BASE_URL}/conversation/{conversation_id}"
         
+        self._rate_limiter.acquire()
+        
         for attempt in range(self.MAX_RETRIES):
             try:
                 response = self.session.get(url, timeout=10)
                 
                 if response.status_code == 200:
-                    return response.json()
+                    return json_loads(response.content)
                 elif response.status_code == 404:
                     return None
                 elif response.status_code == 401:
                     raise PermissionError("Auth token invalid")
                 elif response.status_code == 429:
-                    time.sleep(self.INITIAL_BACKOFF_SECONDS * (2 ** attempt))
+                    time.sleep(self._backoff_seconds(attempt, response))
                     continue
             except requests.exceptions.Timeout:
                 if attempt < self.MAX_RETRIES - 1:
-                    time.sleep(self.INITIAL_BACKOFF_SECONDS * (2 ** attempt))
+                    time.sleep(self._backoff_seconds(attempt))
                 else:
                     return None
         
         return None
     
+    def fetch_conversation_details_bulk(
+        self,
+        conversation_ids: Iterable[str],
+        concurrency: Optional[int] = None
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Any]], Optional[Exception]]]:
+        """
+        Fetch many conversations by ID, up to ``concurrency`` at a time.
+        
+        Yields (conversation_id, detail, error) in input order, where detail
+        is what fetch_conversation_detail returned and error is the exception
+        it raised, if any. At most two requests per worker are in flight.
+        """
+        if concurrency is None:
+            concurrency = self.detail_concurrency
+        elif concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        ids = iter(conversation_ids)
+        pending = deque()
+        
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            try:
+                while True:
+                    while len(pending) < concurrency * 2:
+                        conversation_id = next(ids, _NO_ID)
+                        if conversation_id is _NO_ID:
+                            break
+                        future = executor.submit(self.fetch_conversation_detail, conversation_id)
+                        pending.append((conversation_id, future))
+                    
+                    if not pending:
+                        break
+                    
+                    conversation_id, future = pending.popleft()
+                    try:
+                        detail, error = future.result(), None
+                    except Exception as e:
+                        detail, error = None, e
+                    yield conversation_id, detail, error
+            finally:
+                for _, future in pending:
+                    future.cancel()
+    
     def validate_token(self) -> bool:
-        """Validate that auth token is working."""
+        """
+        Validate that auth token is working.
+        
+        A success is remembered for TOKEN_VALIDATION_TTL_SECONDS so repeated
+        checks in one process do not each hit the network; failures are
+        always re-checked.
+        """
+        validated_at = _validated_tokens.get(self.auth_token)
+        if validated_at is not None and time.monotonic() - validated_at < TOKEN_VALIDATION_TTL_SECONDS:
+            return True
         try:
             response = self.session.get(
                 f"{self.BASE_URL}/conversations",
                 params={"limit": 1},
                 timeout=5
             )
-            return response.status_code == 200
+            if response.status_code == 200:
+                _validated_tokens[self.auth_token] = time.monotonic()
+                return True
+            return False
         except Exception:
             return False
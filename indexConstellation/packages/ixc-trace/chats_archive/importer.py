@@ -4,52 +4,147 @@ Manual import from ChatGPT export JSON files.
 
 import json
 import hashlib
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, Iterator, List, Optional
 from datetime import datetime, timezone
 from pathlib import Path
 
-from chats_archive.storage import LocalEncryptedStore
+from chats_archive.storage import LocalEncryptedStore, json_loads
+
+try:
+    import ijson
+except ImportError:  # optional; see the "stream" extra
+    ijson = None
+
+# Bytes read from the start of an export to tell a bare list of
+# conversations from an object holding them
+STREAM_PEEK_BYTES = 4096
 
 
 class ManualImporter:
     """Imports conversations from ChatGPT export JSON format."""
     
+    # ijson prefix of the conversations, by the export's first JSON byte
+    _STREAM_PREFIXES = {b'[': 'item', b'{': 'conversations.item'}
+    
     def __init__(self, store: LocalEncryptedStore):
         self.store = store
     
-    def import_from_file(self, json_path: str) -> int:
-        """Import conversations from JSON export file."""
+    def import_from_file(self, json_path: str, stream: bool = False) -> int:
+        """
+        Import conversations from JSON export file.
+        
+        By default the export is parsed whole before anything is stored,
+        so a truncated or malformed file fails without writing. With
+        stream=True and ijson installed it is streamed one conversation at
+        a time instead, so memory no longer grows with the size of the
+        file; conversations before any damage are then stored, and the
+        error reports how many.
+        """
         path = Path(json_path).expanduser()
         if not path.exists():
             raise FileNotFoundError(f"File not found: {json_path}")
         
         print(f"📂 Reading {path}...")
         
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if stream and ijson is None:
+            print("⚠️  ijson is not installed (see the \"stream\" extra); loading the export whole.")
         
-        if isinstance(data, dict) and 'conversations' in data:
-            conversations = data['conversations']
-        elif isinstance(data, list):
-            conversations = data
+        if stream and ijson is not None:
+            conversations = self._stream_conversations(path)
+            total = None
         else:
-            raise ValueError("Unexpected JSON structure")
+            conversations = self._load_conversations(path)
+            total = len(conversations)
+            print(f"Found {total} conversations in export.")
         
-        print(f"Found {len(conversations)} conversations in export.")
+        return self._import_all(conversations, total)
+    
+    def import_from_ndjson(self, json_path: str) -> int:
+        """
+        Import conversations stored one JSON object per line (NDJSON).
+        
+        With ijson installed, concatenated JSON objects separated by any
+        whitespace are accepted too. Either way only one conversation is
+        held in memory at a time.
+        """
+        path = Path(json_path).expanduser()
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {json_path}")
         
+        print(f"📂 Reading {path}...")
+        return self._import_all(self._stream_ndjson(path), None)
+    
+    def _import_all(self, conversations: Iterable[Any], total: Optional[int]) -> int:
         imported = 0
-        for i, conv in enumerate(conversations, 1):
-            try:
-                if self._import_single_conversation(conv):
-                    imported += 1
-                if i % 10 == 0:
-                    print(f"  Processed {i}/{len(conversations)}...")
-            except Exception as e:
-                print(f"  ⚠️  Failed to import conversation {i}: {e}")
+        processed = 0
+        try:
+            for i, conv in enumerate(conversations, 1):
+                processed = i
+                try:
+                    if self._import_single_conversation(conv):
+                        imported += 1
+                    if i % 10 == 0:
+                        print(f"  Processed {i}/{total}..." if total is not None else f"  Processed {i}...")
+                except Exception as e:
+                    print(f"  ⚠️  Failed to import conversation {i}: {e}")
+        except Exception as e:
+            if total is not None:
+                raise
+            # A streamed file broke off part way: say what was already
+            # stored (stores overwrite by id, so re-running is safe)
+            raise ValueError(
+                f"Export is truncated or malformed after {processed} conversations; "
+                f"{imported} were stored before the error and a re-run will "
+                f"store them again: {e}"
+            ) from e
         
-        print(f"\n✅ Successfully imported {imported}/{len(conversations)} conversations.")
+        print(f"\n✅ Successfully imported {imported}/{processed} conversations.")
         return imported
     
+    def _load_conversations(self, path: Path) -> List[Any]:
+        """Parse the whole export and return its list of conversations."""
+        # orjson (via json_loads) when installed: this parse dominates
+        # imports of large exports
+        data = json_loads(path.read_bytes())
+        
+        if isinstance(data, dict) and 'conversations' in data:
+            return data['conversations']
+        elif isinstance(data, list):
+            return data
+        else:
+            raise ValueError("Unexpected JSON structure")
+    
+    def _stream_conversations(self, path: Path) -> Iterator[Any]:
+        """
+        Yield the conversations of an export one at a time using ijson.
+        
+        Exports that do not open with a list or object, or in which no
+        conversation is found where expected, are handed to
+        _load_conversations instead, so they fail as they always have.
+        """
+        found = False
+        with open(path, 'rb') as f:
+            prefix = self._STREAM_PREFIXES.get(f.read(STREAM_PEEK_BYTES).lstrip()[:1])
+            if prefix is not None:
+                f.seek(0)
+                for conv in ijson.items(f, prefix, use_float=True):
+                    found = True
+                    yield conv
+        
+        if not found:
+            yield from self._load_conversations(path)
+    
+    @staticmethod
+    def _stream_ndjson(path: Path) -> Iterator[Any]:
+        """Yield each top-level JSON value of an NDJSON/concatenated file."""
+        with open(path, 'rb') as f:
+            if ijson is not None:
+                yield from ijson.items(f, '', multiple_values=True, use_float=True)
+            else:
+                for line in f:
+                    if line.strip():
+                        yield json_loads(line)
+    
     def _import_single_conversation(self, conv_data: Dict[str, Any]) -> bool:
         """Import a single conversation."""
         conv_id = conv_data.get('id', '')
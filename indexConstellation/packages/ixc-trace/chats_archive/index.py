@@ -0,0 +1,222 @@
+"""
+MetadataIndex: Persistent cache of archive wrapper metadata.
+
+Listing and exporting need the plaintext metadata of every wrapper, which
+otherwise means opening and parsing each conv-*.enc file on every run. The
+parsed metadata is kept in a SQLite sidecar next to the archive and re-read
+only for wrappers whose mtime or size changed since they were indexed.
+
+The sidecar also remembers which wrappers last passed integrity
+verification, so an incremental export need not decrypt every stored
+conversation again to decide what to skip.
+"""
+
+import sqlite3
+import json
+import os
+import stat
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from pathlib import Path
+
+from chats_archive.storage import LocalEncryptedStore
+
+
+class MetadataIndex:
+    """SQLite-backed, mtime-invalidated index of wrapper metadata."""
+
+    DB_NAME = ".index.sqlite"
+
+    def __init__(self, store: LocalEncryptedStore):
+        self.store = store
+        self.db_path = store.archive_dir / self.DB_NAME
+        # filepath -> (mtime_ns, size) of wrappers verified with this key
+        self._verified: Optional[Dict[str, Tuple[int, int]]] = None
+        self._newly_verified: List[Tuple[str, int, int, str]] = []
+
+    def _init_db(self, conn: sqlite3.Connection):
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS wrappers (
+                filepath TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                metadata TEXT
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS verified (
+                filepath TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                key_fingerprint TEXT NOT NULL
+            )
+        """)
+        os.chmod(self.db_path, stat.S_IRUSR | stat.S_IWUSR)
+
+    def entries(self) -> List[Tuple[Path, Path, Optional[Any]]]:
+        """
+        Return (date_dir, filepath, metadata) for every conv-*.enc wrapper,
+        newest date directory first.
+
+        metadata is None for wrappers whose metadata could not be read. If
+        the index itself cannot be used, every wrapper is read directly.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                self._init_db(conn)
+                cached = {
+                    row[0]: row[1:]
+                    for row in conn.execute("SELECT filepath, mtime_ns, size, metadata FROM wrappers")
+                }
+                results, updates = self._scan(cached)
+
+                conn.executemany("INSERT OR REPLACE INTO wrappers VALUES (?, ?, ?, ?)", updates)
+                # Whatever is left in cached no longer exists on disk
+                conn.executemany("DELETE FROM wrappers WHERE filepath = ?", [(key,) for key in cached])
+                conn.executemany("DELETE FROM verified WHERE filepath = ?", [(key,) for key in cached])
+                conn.commit()
+            return results
+        except (sqlite3.Error, OSError):
+            results, _ = self._scan({})
+            return results
+
+    def lookup_filter(self) -> Callable[[str], bool]:
+        """
+        Return a predicate that is False only for conversation ids that
+        store.find_wrapper_path_for_conversation cannot resolve, so callers
+        can skip its full metadata scan for conversations not yet archived.
+
+        Built from one pass over the index: metadata ids, new-scheme file
+        tokens and legacy 8-character filename prefixes.
+        """
+        ids = set()
+        tokens = set()
+        prefixes = set()
+        for _, filepath, metadata in self.entries():
+            stem = filepath.name[len("conv-"):-len(".enc")]
+            tokens.add(stem)
+            if len(stem) >= 8:
+                prefixes.add(os.path.normcase(stem[:8]))
+            if isinstance(metadata, dict):
+                ids.add(metadata.get("id") or metadata.get("conversation_id"))
+
+        def may_resolve(conversation_id: str) -> bool:
+            if conversation_id in ids or self.store.file_token(conversation_id) in tokens:
+                return True
+            prefix = conversation_id[:8]
+            if len(prefix) < 8 or any(c in prefix for c in "*?["):
+                # Short or glob-like prefixes: let the store decide
+                return True
+            return os.path.normcase(prefix) in prefixes
+
+        return may_resolve
+
+    def has_valid_conversation(self, conversation_id: str) -> bool:
+        """
+        store.has_valid_conversation, skipping the decrypt and checksum for
+        a wrapper that already verified under the current key and has not
+        changed (same mtime and size) since.
+
+        Meant for deciding what an export may skip; verify-archive and
+        reads always verify in full. Call save_verified() to persist new
+        results.
+        """
+        if not self.store.key_matches_manifest():
+            return False
+
+        filepath = self.store.find_wrapper_path_for_conversation(conversation_id)
+        if not filepath:
+            return False
+        st = filepath.stat()
+        key = str(filepath)
+
+        if self._verified is None:
+            self._verified = self._load_verified()
+        if self._verified.get(key) == (st.st_mtime_ns, st.st_size):
+            return True
+
+        if not self.store.has_valid_conversation(conversation_id):
+            return False
+        self._verified[key] = (st.st_mtime_ns, st.st_size)
+        self._newly_verified.append((key, st.st_mtime_ns, st.st_size, self.store.key_fingerprint))
+        return True
+
+    def save_verified(self):
+        """Persist verifications made by has_valid_conversation."""
+        if not self._newly_verified:
+            return
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                self._init_db(conn)
+                conn.executemany("INSERT OR REPLACE INTO verified VALUES (?, ?, ?, ?)", self._newly_verified)
+                conn.commit()
+        except (sqlite3.Error, OSError):
+            pass
+        self._newly_verified = []
+
+    def _load_verified(self) -> Dict[str, Tuple[int, int]]:
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                self._init_db(conn)
+                return {
+                    row[0]: (row[1], row[2])
+                    for row in conn.execute(
+                        "SELECT filepath, mtime_ns, size FROM verified WHERE key_fingerprint = ?",
+                        (self.store.key_fingerprint,)
+                    )
+                }
+        except (sqlite3.Error, OSError):
+            return {}
+
+    def _scan(self, cached: dict) -> Tuple[list, list]:
+        """
+        Walk the archive, reusing cached metadata for unchanged wrappers.
+        Entries found on disk are removed from ``cached``.
+        """
+        results = []
+        updates = []
+
+        conversations_dir = self.store.conversations_dir
+        if not conversations_dir.exists():
+            return results, updates
+
+        # os.scandir rather than iterdir/glob: names are matched directly,
+        # and no Path is built for entries that are not wrappers.
+        with os.scandir(conversations_dir) as it:
+            date_entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name, reverse=True)
+
+        for date_entry in date_entries:
+            date_dir = Path(date_entry.path)
+            try:
+                with os.scandir(date_entry.path) as it:
+                    file_entries = [
+                        e for e in it
+                        if e.name.startswith("conv-") and e.name.endswith(".enc")
+                    ]
+            except OSError:
+                # Unreadable date directory; glob skipped these silently too
+                continue
+            for entry in file_entries:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+
+                key = entry.path
+                filepath = Path(key)
+                row = cached.pop(key, None)
+                if row is not None and row[0] == st.st_mtime_ns and row[1] == st.st_size:
+                    metadata_json = row[2]
+                else:
+                    metadata_json = self._read_metadata_json(filepath)
+                    updates.append((key, st.st_mtime_ns, st.st_size, metadata_json))
+
+                metadata = json.loads(metadata_json) if metadata_json is not None else None
+                results.append((date_dir, filepath, metadata))
+
+        return results, updates
+
+    def _read_metadata_json(self, filepath: Path) -> Optional[str]:
+        try:
+            return json.dumps(self.store.load_wrapper_metadata(filepath))
+        except Exception:
+            return None
@@ -2,14 +2,14 @@
 Pydantic models for ChatGPT conversation archival.
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, constr
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 
 class ConversationMetadata(BaseModel):
     """Metadata for a single conversation"""
-    conversation_id: str = Field(..., alias="id")
+    conversation_id: constr(min_length=1) = Field(..., alias="id")
     title: Optional[str] = None
     created_at: datetime
     updated_at: datetime
@@ -17,19 +17,15 @@ class ConversationMetadata(BaseModel):
     
     class Config:
         allow_population_by_field_name = True
-    
-    @validator('conversation_id')
-    def validate_id(cls, v):
-        if not v or not isinstance(v, str):
-            raise ValueError("conversation_id must be non-empty string")
-        return v
 
 
 class EncryptedConversation(BaseModel):
     """Stored representation: metadata plaintext, content encrypted"""
     metadata: ConversationMetadata
-    encrypted_content: str  # base64-encoded encrypted JSON
+    encrypted_content: str  # Fernet token of the JSON (base64 of it before 1.2)
+    encoding: Optional[str] = None  # "fernet-token" when encrypted_content is the token itself
     encryption_version: str = "fernet-v1"
+    compression: Optional[str] = None  # "zlib" when the JSON was compressed first
     checksum: str
     archived_at: datetime = Field(default_factory=datetime.utcnow)
     version: str = Field(default="1.0")
@@ -10,16 +10,22 @@ import time
 from typing import Optional, List
 from datetime import datetime
 from pathlib import Path
-import uuid
+import secrets
 
 from chats_archive.auth import ProtectedLogger, TokenManager
 from chats_archive.fetcher import ConversationFetcher, APIStatus
 from chats_archive.storage import LocalEncryptedStore
+from chats_archive.index import MetadataIndex
 
 
 class LockFile:
     """Platform-appropriate file locking."""
 
+    # acquire() polls a held lock starting at this interval, doubling up to
+    # MAX_POLL_SECONDS
+    INITIAL_POLL_SECONDS = 0.01
+    MAX_POLL_SECONDS = 0.2
+
     def __init__(self, lock_path: str):
         self.lock_path = Path(lock_path).expanduser()
         self.lock_file = None
@@ -42,9 +48,15 @@ class LockFile:
 
     def acquire(self, timeout: float = 0.0) -> bool:
         start = time.time()
+        try:
+            # Opened once; only the lock itself is retried
+            self.lock_file = open(self.lock_path, 'w')
+        except OSError:
+            return False
+
+        delay = self.INITIAL_POLL_SECONDS
         while True:
             try:
-                self.lock_file = open(self.lock_path, 'w')
                 if self._fcntl:
                     self._fcntl.flock(self.lock_file, self._fcntl.LOCK_EX | self._fcntl.LOCK_NB)
                 elif self._msvcrt:
@@ -56,10 +68,12 @@ class LockFile:
                 self._lock_acquired = True
                 return True
             except (IOError, OSError, BlockingIOError):
-                self._close_file()
-                if timeout <= 0 or (time.time() - start) >= timeout:
+                elapsed = time.time() - start
+                if timeout <= 0 or elapsed >= timeout:
+                    self._close_file()
                     return False
-                time.sleep(0.1)
+                time.sleep(min(delay, timeout - elapsed))
+                delay = min(delay * 2, self.MAX_POLL_SECONDS)
             except Exception:
                 self._close_file()
                 return False
@@ -97,16 +111,30 @@ class LockFile:
 
 
 class JobTracker:
-    """SQLite-based job tracking."""
+    """
+    SQLite-based job tracking.
+
+    One connection is held for the tracker's lifetime, in WAL mode so
+    status reads do not wait on an export's writes; call close() when done.
+    """
+
+    INSERT_JOB_SQL = "INSERT INTO jobs (job_id, started_at, status) VALUES (?, ?, ?)"
+    SELECT_JOB_SQL = "SELECT * FROM jobs WHERE job_id = ?"
+    SELECT_LAST_JOB_SQL = "SELECT * FROM jobs ORDER BY created_at DESC LIMIT 1"
 
     def __init__(self, db_path: str = "~/.chats_archive/jobs.db"):
         self.db_path = Path(db_path).expanduser()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(
+            "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY;"
+        )
         self._init_db()
 
     def _init_db(self):
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
+        with self._conn:
+            self._conn.execute("""
                 CREATE TABLE IF NOT EXISTS jobs (
                     job_id TEXT PRIMARY KEY,
                     started_at TEXT NOT NULL,
@@ -119,16 +147,19 @@ class JobTracker:
                     created_at TEXT DEFAULT CURRENT_TIMESTAMP
                 )
             """)
-            conn.commit()
+            # get_last_job reads the newest row off this index instead of sorting the table
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs(created_at DESC)")
+
+    def close(self):
+        self._conn.close()
 
     def create_job(self) -> str:
-        job_id = str(uuid.uuid4())[:8]
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                "INSERT INTO jobs (job_id, started_at, status) VALUES (?, ?, ?)",
+        job_id = secrets.token_hex(4)
+        with self._conn:
+            self._conn.execute(
+                self.INSERT_JOB_SQL,
                 (job_id, datetime.utcnow().isoformat(), "pending")
             )
-            conn.commit()
         return job_id
 
     def update_job_status(self, job_id: str, status: str, **kwargs):
@@ -139,45 +170,47 @@ class JobTracker:
         if "errors" in updates and isinstance(updates["errors"], list):
             updates["errors"] = json.dumps(updates["errors"])
 
-        with sqlite3.connect(self.db_path) as conn:
-            for key, value in updates.items():
-                conn.execute(f"UPDATE jobs SET {key} = ? WHERE job_id = ?", (value, job_id))
-            conn.commit()
+        assignments = ", ".join(f"{key} = ?" for key in updates)
+        with self._conn:
+            self._conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE job_id = ?",
+                (*updates.values(), job_id)
+            )
 
     def get_job(self, job_id: str) -> Optional[dict]:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
-            row = cursor.fetchone()
-        if not row:
-            return None
-        return {
-            "job_id": row[0], "started_at": row[1], "completed_at": row[2],
-            "total_conversations": row[3], "successful_conversations": row[4],
-            "failed_conversations": row[5], "errors": json.loads(row[6]) if row[6] else [],
-            "status": row[7]
-        }
+        return self._row_to_job(self._conn.execute(self.SELECT_JOB_SQL, (job_id,)).fetchone())
 
     def get_last_job(self) -> Optional[dict]:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT * FROM jobs ORDER BY created_at DESC LIMIT 1")
-            row = cursor.fetchone()
+        return self._row_to_job(self._conn.execute(self.SELECT_LAST_JOB_SQL).fetchone())
+
+    @staticmethod
+    def _row_to_job(row: Optional[sqlite3.Row]) -> Optional[dict]:
         if not row:
             return None
         return {
-            "job_id": row[0], "started_at": row[1], "completed_at": row[2],
-            "total_conversations": row[3], "successful_conversations": row[4],
-            "failed_conversations": row[5], "errors": json.loads(row[6]) if row[6] else [],
-            "status": row[7]
+            "job_id": row["job_id"], "started_at": row["started_at"], "completed_at": row["completed_at"],
+            "total_conversations": row["total_conversations"],
+            "successful_conversations": row["successful_conversations"],
+            "failed_conversations": row["failed_conversations"],
+            "errors": json.loads(row["errors"]) if row["errors"] else [],
+            "status": row["status"]
         }
 
 
 class ArchiveOrchestrator:
     """Orchestrates exports with resume capability and integrity-aware skipping."""
 
-    def __init__(self, token_manager: TokenManager, archive_dir: str = "~/.chats_archive", logger: Optional[ProtectedLogger] = None):
+    def __init__(
+        self,
+        token_manager: TokenManager,
+        archive_dir: str = "~/.chats_archive",
+        logger: Optional[ProtectedLogger] = None,
+        detail_concurrency: Optional[int] = None
+    ):
         self.token_manager = token_manager
         self.archive_dir = archive_dir
         self.logger = logger or ProtectedLogger()
+        self.detail_concurrency = detail_concurrency
         self.job_tracker = JobTracker()
         self.lock_path = Path(archive_dir).expanduser() / ".lock"
 
@@ -207,7 +240,7 @@ class ArchiveOrchestrator:
             if not auth_token:
                 raise RuntimeError("No auth token available")
 
-            fetcher = ConversationFetcher(auth_token, self.logger)
+            fetcher = ConversationFetcher(auth_token, self.logger, self.detail_concurrency)
             store = LocalEncryptedStore(self.archive_dir, self.logger)
 
             print("🔍 Checking API status...")
@@ -243,24 +276,59 @@ class ArchiveOrchestrator:
             detail_404 = 0
             detail_429 = 0
 
+            # Integrity-aware skip: only skip if stored AND decrypt+checksum
+            # verifies. Deciding this up front lets the remaining details be
+            # fetched concurrently, in list order, while the loop below stores
+            # them. Conversations the index shows cannot be in the archive are
+            # not looked up at all, sparing a scan of every wrapper per new id,
+            # and unchanged wrappers that verified on an earlier run are not
+            # decrypted again.
+            already_stored = set()
+            if not force_refetch:
+                index = MetadataIndex(store)
+                may_be_stored = index.lookup_filter()
+                for i, conv_metadata in enumerate(conversations_list, 1):
+                    conv_id = conv_metadata.get('id', 'unknown')
+                    try:
+                        if (
+                            conv_id != "unknown"
+                            and may_be_stored(conv_id)
+                            and index.has_valid_conversation(conv_id)
+                        ):
+                            already_stored.add(i)
+                    except Exception as e:
+                        # Unverifiable copies are fetched again
+                        if self.logger:
+                            self.logger.log_error("verify", f"{conv_id[:8]} {e}")
+                index.save_verified()
+
+            details = fetcher.fetch_conversation_details_bulk(
+                conv_metadata.get('id', 'unknown')
+                for i, conv_metadata in enumerate(conversations_list, 1)
+                if i not in already_stored
+            )
+
             for i, conv_metadata in enumerate(conversations_list, 1):
                 conv_id = conv_metadata.get('id', 'unknown')
 
                 try:
-                    # Integrity-aware skip: only skip if stored AND decrypt+checksum verifies
-                    if not force_refetch and conv_id != "unknown" and store.has_valid_conversation(conv_id):
+                    if i in already_stored:
                         successful += 1
                         continue
 
-                    full_conv = fetcher.fetch_conversation_detail(conv_id)
+                    _, full_conv, detail_error = next(details)
+                    if detail_error is not None:
+                        raise detail_error
 
                     if full_conv:
                         consecutive_detail_failures = 0
 
                         # Normalize stored metadata with explicit provenance
-                        md = dict(conv_metadata)
-                        md["source"] = md.get("source", "fetch")
-                        md["job_id"] = job_id
+                        md = {
+                            **conv_metadata,
+                            "source": conv_metadata.get("source", "fetch"),
+                            "job_id": job_id,
+                        }
 
                         if store.store_conversation(full_conv, md):
                             successful += 1
@@ -342,3 +410,7 @@ class ArchiveOrchestrator:
 
     def get_last_export(self) -> Optional[dict]:
         return self.job_tracker.get_last_job()
+
+    def close(self):
+        """Release the job database connection."""
+        self.job_tracker.close()
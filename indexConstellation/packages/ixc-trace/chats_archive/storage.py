@@ -12,6 +12,8 @@ import os
 import hashlib
 import json
 import base64
+import mmap
+import zlib
 from typing import Optional, List, Dict, Any, Iterator, Tuple
 from datetime import datetime
 from pathlib import Path
@@ -21,8 +23,61 @@ from enum import Enum
 from cryptography.fernet import Fernet, InvalidToken
 import stat
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; see the "fast" extra
+    orjson = None
+
 from chats_archive.models import EncryptedConversation, ConversationMetadata
 
+# Characters read from the head of a wrapper file when only its metadata is
+# needed; metadata larger than this falls back to a full load.
+WRAPPER_HEAD_CHARS = 64 * 1024
+
+# How json.dump (default separators) begins a wrapper written by
+# store_conversation
+_WRAPPER_METADATA_PREFIX = '{"metadata": '
+_JSON_DECODER = json.JSONDecoder()
+
+# "encoding" of a wrapper whose encrypted_content holds the Fernet token
+# itself; wrappers without the field hold it from RAW_TOKEN_STORAGE_VERSION
+# on, and base64 of it before that
+RAW_TOKEN_ENCODING = "fernet-token"
+RAW_TOKEN_STORAGE_VERSION = "1.2"
+
+# zlib level for conversation JSON compressed before encryption; higher
+# levels cost several times the CPU for a few percent more
+ZLIB_LEVEL = 3
+
+
+def json_loads(data):
+    """
+    json.loads, through orjson when it is installed. orjson is stricter
+    (no NaN, lone surrogates or integers beyond 64 bits), so anything it
+    rejects is handed to json, which also supplies the error.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _version_tuple(version: Any) -> Tuple[int, ...]:
+    try:
+        return tuple(int(part) for part in str(version).split("."))
+    except ValueError:
+        return ()
+
+
+def stores_raw_token(wrapper: Dict[str, Any]) -> bool:
+    """True if the wrapper's encrypted_content is the Fernet token itself."""
+    encoding = wrapper.get("encoding")
+    if encoding is not None:
+        return encoding == RAW_TOKEN_ENCODING
+    return _version_tuple(wrapper.get("version")) >= _version_tuple(RAW_TOKEN_STORAGE_VERSION)
+
 
 class IntegrityState(Enum):
     VALID = "valid"
@@ -105,7 +160,7 @@ class EncryptionKeyManager:
 class LocalEncryptedStore:
     """Stores conversations locally with encryption at rest, with verifiable integrity."""
 
-    STORAGE_VERSION = "1.1"
+    STORAGE_VERSION = "1.2"
 
     def __init__(self, archive_dir: str = "~/.chats_archive", logger=None):
         self.archive_dir = Path(archive_dir).expanduser()
@@ -122,6 +177,11 @@ class LocalEncryptedStore:
         self._key_mismatch = False
         self._load_or_init_manifest()
 
+        # conversation_id -> wrapper path, built by the first metadata scan
+        self._scanned_paths: Optional[Dict[str, Path]] = None
+        # conversation_id -> wrapper path last resolved for it
+        self._resolved_paths: Dict[str, Path] = {}
+
     def _init_directories(self):
         """Create archive directory structure with secure permissions"""
         self.archive_dir.mkdir(parents=True, exist_ok=True)
@@ -133,8 +193,8 @@ class LocalEncryptedStore:
     # -------------------------
 
     @staticmethod
-    def _file_token(conversation_id: str) -> str:
-        """Stable, collision-resistant token for filenames."""
+    def file_token(conversation_id: str) -> str:
+        """Stable, collision-resistant token for filenames (conv-<token>.enc)."""
         return hashlib.sha256(conversation_id.encode()).hexdigest()[:16]
 
     def _iter_archive_files(self, pattern: str = "conv-*.enc") -> Iterator[Path]:
@@ -148,7 +208,7 @@ class LocalEncryptedStore:
                 yield filepath
 
     def _wrapper_path_for(self, conversation_id: str, date_str: str) -> Path:
-        token = self._file_token(conversation_id)
+        token = self.file_token(conversation_id)
         return (self.conversations_dir / date_str) / f"conv-{token}.enc"
 
     # -------------------------
@@ -179,18 +239,22 @@ class LocalEncryptedStore:
             if self.logger:
                 self.logger.log_error("archive_manifest", str(e)[:200])
 
-    def _ensure_key_matches_manifest(self) -> bool:
+    def key_matches_manifest(self) -> bool:
         """Return False if key mismatch detected; used to fail closed."""
         return not getattr(self, "_key_mismatch", False)
 
     def store_conversation(self, conversation: Dict[str, Any], metadata_dict: Dict[str, Any]) -> bool:
         """Store conversation with encryption."""
         try:
-            conversation_json = json.dumps(conversation, default=str)
-            conversation_bytes = conversation_json.encode()
-            checksum = hashlib.sha256(conversation_bytes).hexdigest()
-            encrypted = self.cipher.encrypt(conversation_bytes)
-            encrypted_b64 = base64.b64encode(encrypted).decode()
+            conversation_bytes = json.dumps(conversation, default=str).encode()
+            # Compressed before encryption: conversation JSON shrinks
+            # several-fold, so Fernet and the checksum see far fewer bytes.
+            # The checksum covers what is encrypted, as before.
+            payload = zlib.compress(conversation_bytes, ZLIB_LEVEL)
+            checksum = hashlib.sha256(payload).hexdigest()
+            # A Fernet token is already URL-safe base64 text; since 1.2 it
+            # is stored as is instead of being base64-encoded again
+            encrypted = self.cipher.encrypt(payload).decode()
 
             today = datetime.utcnow().strftime("%Y-%m-%d")
             date_dir = self.conversations_dir / today
@@ -205,17 +269,25 @@ class LocalEncryptedStore:
 
             stored_obj = {
                 "metadata": metadata_dict,
-                "encrypted_content": encrypted_b64,
+                "encrypted_content": encrypted,
+                "encoding": RAW_TOKEN_ENCODING,
                 "encryption_version": "fernet-v1",
+                "compression": "zlib",
                 "checksum": checksum,
                 "archived_at": datetime.utcnow().isoformat(),
                 "version": self.STORAGE_VERSION
             }
 
-            with open(filepath, 'w') as f:
+            # Created owner-only, so the plaintext metadata is never
+            # readable under the default umask; chmod still covers
+            # wrappers that already existed with wider permissions
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, stat.S_IRUSR | stat.S_IWUSR)
+            with os.fdopen(fd, 'w') as f:
                 json.dump(stored_obj, f, default=str)
 
             os.chmod(filepath, stat.S_IRUSR | stat.S_IWUSR)
+            # An older wrapper may have been resolved for this id
+            self._resolved_paths.pop(conv_id, None)
 
             if self.logger:
                 self.logger.log_storage(conv_id, len(conversation_bytes), True)
@@ -232,20 +304,55 @@ class LocalEncryptedStore:
 
     def _load_wrapper(self, filepath: Path) -> Optional[Dict[str, Any]]:
         try:
-            with open(filepath, 'r') as f:
-                return json.load(f)
+            with open(filepath, 'rb') as f:
+                if orjson is None:
+                    return json.loads(f.read())
+                # orjson parses straight from the mapped file, so the whole
+                # wrapper is never copied into a bytes object first
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        try:
+                            return orjson.loads(view)
+                        except orjson.JSONDecodeError:
+                            pass
+                    return json.loads(mm[:])
         except Exception as e:
             if self.logger:
                 self.logger.log_error("load_wrapper", str(e))
             return None
 
+    @staticmethod
+    def load_wrapper_metadata(filepath: Path) -> Dict[str, Any]:
+        """
+        Return the plaintext metadata of a wrapper file without parsing the
+        encrypted payload.
+
+        store_conversation writes "metadata" as the first key, so it is
+        decoded from the head of the file; any other layout falls back to
+        loading the whole wrapper. Raises like json.load on unreadable files.
+        """
+        with open(filepath, 'r') as f:
+            head = f.read(WRAPPER_HEAD_CHARS)
+            if head.startswith(_WRAPPER_METADATA_PREFIX):
+                try:
+                    metadata, _ = _JSON_DECODER.raw_decode(head, len(_WRAPPER_METADATA_PREFIX))
+                    return metadata
+                except json.JSONDecodeError:
+                    pass
+            wrapper = json_loads(head + f.read())
+        return wrapper.get("metadata", {})
+
     def _decrypt_bytes(self, wrapper: Dict[str, Any]) -> Tuple[Optional[bytes], Optional[str]]:
         """Return (decrypted_bytes, error_code)."""
-        encrypted_b64 = wrapper.get("encrypted_content", "")
-        if not encrypted_b64:
+        encrypted_content = wrapper.get("encrypted_content", "")
+        if not encrypted_content:
             return None, "WRAPPER_NO_CONTENT"
         try:
-            encrypted = base64.b64decode(encrypted_b64)
+            if stores_raw_token(wrapper):
+                encrypted = encrypted_content.encode()
+            else:
+                # Wrappers before 1.2 base64-encoded the token once more
+                encrypted = base64.b64decode(encrypted_content)
         except Exception:
             return None, "WRAPPER_B64_DECODE_FAIL"
         try:
@@ -259,13 +366,17 @@ class LocalEncryptedStore:
     def _verify_wrapper(self, conversation_id: str, filepath: Path, wrapper: Dict[str, Any], return_content: bool = False):
         """Verify wrapper integrity; optionally return decrypted content dict."""
         expected_checksum = wrapper.get("checksum", None)
+        try:
+            size_bytes = filepath.stat().st_size
+        except OSError:
+            size_bytes = None
         decrypted_bytes, err = self._decrypt_bytes(wrapper)
         if decrypted_bytes is None:
             res = IntegrityResult(
                 conversation_id=conversation_id,
                 state=IntegrityState.UNREADABLE if err else IntegrityState.UNKNOWN,
                 filepath=str(filepath),
-                size_bytes=filepath.stat().st_size if filepath.exists() else None,
+                size_bytes=size_bytes,
                 expected_checksum=expected_checksum,
                 actual_checksum=None,
                 error_code=err or "VERIFY_UNKNOWN"
@@ -280,7 +391,7 @@ class LocalEncryptedStore:
                 conversation_id=conversation_id,
                 state=IntegrityState.CORRUPT,
                 filepath=str(filepath),
-                size_bytes=filepath.stat().st_size if filepath.exists() else None,
+                size_bytes=size_bytes,
                 expected_checksum=expected_checksum,
                 actual_checksum=actual_checksum,
                 error_code="CHECKSUM_MISMATCH"
@@ -291,7 +402,7 @@ class LocalEncryptedStore:
             conversation_id=conversation_id,
             state=IntegrityState.VALID,
             filepath=str(filepath),
-            size_bytes=filepath.stat().st_size if filepath.exists() else None,
+            size_bytes=size_bytes,
             expected_checksum=expected_checksum,
             actual_checksum=actual_checksum,
             error_code=None
@@ -301,13 +412,15 @@ class LocalEncryptedStore:
             return res, None
 
         try:
-            return res, json.loads(decrypted_bytes.decode())
+            if wrapper.get("compression") == "zlib":
+                decrypted_bytes = zlib.decompress(decrypted_bytes)
+            return res, json_loads(decrypted_bytes)
         except Exception:
             return IntegrityResult(
                 conversation_id=conversation_id,
                 state=IntegrityState.UNKNOWN,
                 filepath=str(filepath),
-                size_bytes=filepath.stat().st_size if filepath.exists() else None,
+                size_bytes=size_bytes,
                 expected_checksum=expected_checksum,
                 actual_checksum=actual_checksum,
                 error_code="JSON_DECODE_FAIL"
@@ -318,9 +431,17 @@ class LocalEncryptedStore:
     # -------------------------
 
     def _find_by_new_token(self, conversation_id: str) -> Optional[Path]:
-        token = self._file_token(conversation_id)
-        for fp in self._iter_archive_files(f"conv-{token}.enc"):
-            return fp
+        if not self.conversations_dir.exists():
+            return None
+        # The token fixes the filename, so each date directory is probed
+        # for it directly; directories are visited in the order glob used
+        name = f"conv-{self.file_token(conversation_id)}.enc"
+        with os.scandir(self.conversations_dir) as it:
+            date_paths = [entry.path for entry in it if entry.is_dir()]
+        for date_path in date_paths:
+            filepath = os.path.join(date_path, name)
+            if os.path.exists(filepath):
+                return Path(filepath)
         return None
 
     def _find_by_legacy_prefix(self, conversation_id: str) -> Optional[Path]:
@@ -330,23 +451,53 @@ class LocalEncryptedStore:
         return None
 
     def _find_by_metadata_scan(self, conversation_id: str) -> Optional[Path]:
+        """
+        Last-resort lookup by the id recorded in wrapper metadata.
+
+        The first call reads every wrapper once and remembers where each id
+        lives, so later misses in the same session do not rescan the
+        archive. Wrappers written since are found by token before this is
+        reached; a remembered path that has since vanished triggers a rescan.
+        """
+        if self._scanned_paths is not None:
+            fp = self._scanned_paths.get(conversation_id)
+            if fp is None or fp.exists():
+                return fp
+
+        self._scanned_paths = {}
         for fp in self._iter_archive_files("conv-*.enc"):
             wrapper = self._load_wrapper(fp)
-            if not wrapper:
+            if not isinstance(wrapper, dict):
                 continue
             md = wrapper.get("metadata", {})
             cid = md.get("id") or md.get("conversation_id")
-            if cid == conversation_id:
-                return fp
-        return None
+            if isinstance(cid, str):
+                # First match wins, as when the scan stopped at it
+                self._scanned_paths.setdefault(cid, fp)
+        return self._scanned_paths.get(conversation_id)
 
     def find_wrapper_path_for_conversation(self, conversation_id: str) -> Optional[Path]:
-        """Best-effort: new scheme -> legacy prefix -> metadata scan."""
-        return (
+        """
+        Best-effort: new scheme -> legacy prefix -> metadata scan.
+
+        A path found earlier is reused while it still exists, so checking
+        and then reading a conversation resolves it once. Misses are not
+        remembered; store_conversation forgets the id it writes.
+        """
+        fp = self._resolved_paths.get(conversation_id)
+        if fp is not None and fp.exists():
+            return fp
+
+        fp = (
             self._find_by_new_token(conversation_id)
             or self._find_by_legacy_prefix(conversation_id)
             or self._find_by_metadata_scan(conversation_id)
         )
+        if fp is not None:
+            self._resolved_paths[conversation_id] = fp
+        else:
+            self._resolved_paths.pop(conversation_id, None)
+        return fp
 
     # -------------------------
     # Public verification API (C1)
@@ -358,7 +509,7 @@ class LocalEncryptedStore:
 
     def verify_conversation(self, conversation_id: str) -> IntegrityResult:
         """Verify integrity of a stored conversation without returning content."""
-        if not self._ensure_key_matches_manifest():
+        if not self.key_matches_manifest():
             return IntegrityResult(
                 conversation_id=conversation_id,
                 state=IntegrityState.UNREADABLE,
@@ -392,7 +543,7 @@ class LocalEncryptedStore:
 
     def retrieve_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve and decrypt conversation content (fails closed on integrity issues)."""
-        if not self._ensure_key_matches_manifest():
+        if not self.key_matches_manifest():
             if self.logger:
                 self.logger.log_error("retrieve_conversation", "WRONG_KEY_MANIFEST_MISMATCH")
             return None
@@ -421,25 +572,39 @@ class LocalEncryptedStore:
         oldest_date = None
         newest_date = None
 
-        for filepath in self._iter_archive_files():
-            wrapper = self._load_wrapper(filepath)
-            if wrapper:
-                md = wrapper.get("metadata", {})
-                cid = md.get("id") or md.get("conversation_id")
-                if cid:
-                    conversation_ids.add(cid)
-            total_size += filepath.stat().st_size
-
-            date_dir = filepath.parent
-            if date_dir.name:
-                try:
-                    dir_date = datetime.strptime(date_dir.name, "%Y-%m-%d")
-                    if not oldest_date or dir_date < oldest_date:
-                        oldest_date = dir_date
-                    if not newest_date or dir_date > newest_date:
-                        newest_date = dir_date
-                except ValueError:
-                    pass
+        if self.conversations_dir.exists():
+            with os.scandir(self.conversations_dir) as it:
+                date_paths = [entry.path for entry in it if entry.is_dir()]
+        else:
+            date_paths = []
+
+        for date_path in date_paths:
+            date_dir = Path(date_path)
+            found = False
+            with os.scandir(date_path) as it:
+                for entry in it:
+                    if not (entry.name.startswith("conv-") and entry.name.endswith(".enc")):
+                        continue
+                    found = True
+                    wrapper = self._load_wrapper(date_dir / entry.name)
+                    if wrapper:
+                        md = wrapper.get("metadata", {})
+                        cid = md.get("id") or md.get("conversation_id")
+                        if cid:
+                            conversation_ids.add(cid)
+                    total_size += entry.stat().st_size
+
+            if not found:
+                continue
+            # Parsed once per date directory rather than once per wrapper
+            try:
+                dir_date = datetime.strptime(date_dir.name, "%Y-%m-%d")
+                if not oldest_date or dir_date < oldest_date:
+                    oldest_date = dir_date
+                if not newest_date or dir_date > newest_date:
+                    newest_date = dir_date
+            except ValueError:
+                pass
 
         return {
             "total_conversations": len(conversation_ids),
@@ -7,7 +7,7 @@ WARNING:
 - Always back up the archive directory before running.
 
 Usage:
-  python scripts/rotate_key.py --archive-dir ~/.chats_archive --old-key <OLD> --new-key <NEW>
+  python scripts/rotate_key.py --archive-dir ~/.chats_archive --old-key <OLD> --new-key <NEW> [--workers N]
 """
 
 import argparse
@@ -16,15 +16,68 @@ import json
 import os
 import stat
 import hashlib
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from cryptography.fernet import Fernet, InvalidToken
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chats_archive.storage import RAW_TOKEN_ENCODING, json_loads, stores_raw_token
+
+
+def rotate_one(fp: Path, old_cipher: Fernet, new_cipher: Fernet) -> bool:
+    """Re-encrypt one wrapper in place; False if it could not be rotated."""
+    try:
+        # Writes below stay on json.dumps: readers rely on its
+        # '{"metadata": ' prefix
+        data = json_loads(fp.read_bytes())
+        enc_content = data.get("encrypted_content")
+        if not enc_content:
+            return False
+        # Keep each wrapper's layout: the Fernet token stored as is (see
+        # stores_raw_token), or base64-encoded once more as before 1.2
+        raw_token = stores_raw_token(data)
+        decrypted = old_cipher.decrypt(enc_content.encode() if raw_token else base64.b64decode(enc_content))
+        checksum = hashlib.sha256(decrypted).hexdigest()
+
+        new_enc = new_cipher.encrypt(decrypted)
+        data["encrypted_content"] = new_enc.decode() if raw_token else base64.b64encode(new_enc).decode()
+        if raw_token:
+            data["encoding"] = RAW_TOKEN_ENCODING
+        data["checksum"] = checksum
+        data["archived_at"] = data.get("archived_at") or datetime.utcnow().isoformat()
+
+        fp.write_text(json.dumps(data, default=str))
+        os.chmod(fp, stat.S_IRUSR | stat.S_IWUSR)
+        return True
+    except InvalidToken:
+        return False
+    except Exception:
+        return False
+
+
+# Ciphers built once per worker process from the key strings
+_worker_ciphers = None
+
+
+def _init_worker(old_key: str, new_key: str):
+    global _worker_ciphers
+    _worker_ciphers = (Fernet(old_key.encode()), Fernet(new_key.encode()))
+
+
+def _rotate_in_worker(fp: Path) -> bool:
+    return rotate_one(fp, *_worker_ciphers)
+
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--archive-dir", default="~/.chats_archive")
     ap.add_argument("--old-key", required=True)
     ap.add_argument("--new-key", required=True)
+    ap.add_argument("--workers", type=int, default=1,
+                    help="Worker processes for decryption and re-encryption")
     args = ap.parse_args()
 
     archive_dir = Path(args.archive_dir).expanduser()
@@ -37,34 +90,26 @@ def main():
     if not conv_dir.exists():
         raise SystemExit(f"No conversations dir found at {conv_dir}")
 
-    rotated = 0
-    failed = 0
-
-    for date_dir in conv_dir.iterdir():
-        if not date_dir.is_dir():
-            continue
-        for fp in date_dir.glob("conv-*.enc"):
-            try:
-                data = json.loads(fp.read_text())
-                enc_b64 = data.get("encrypted_content")
-                if not enc_b64:
-                    failed += 1
-                    continue
-                decrypted = old_cipher.decrypt(base64.b64decode(enc_b64))
-                checksum = hashlib.sha256(decrypted).hexdigest()
-
-                new_enc = new_cipher.encrypt(decrypted)
-                data["encrypted_content"] = base64.b64encode(new_enc).decode()
-                data["checksum"] = checksum
-                data["archived_at"] = data.get("archived_at") or datetime.utcnow().isoformat()
-
-                fp.write_text(json.dumps(data, default=str))
-                os.chmod(fp, stat.S_IRUSR | stat.S_IWUSR)
-                rotated += 1
-            except InvalidToken:
-                failed += 1
-            except Exception:
-                failed += 1
+    paths = [
+        fp
+        for date_dir in conv_dir.iterdir() if date_dir.is_dir()
+        for fp in date_dir.glob("conv-*.enc")
+    ]
+
+    if args.workers > 1:
+        # Each wrapper is independent and CPU-bound; workers build their
+        # own ciphers rather than receiving pickled ones.
+        with ProcessPoolExecutor(
+            max_workers=args.workers,
+            initializer=_init_worker,
+            initargs=(args.old_key, args.new_key)
+        ) as executor:
+            results = list(executor.map(_rotate_in_worker, paths, chunksize=32))
+    else:
+        results = [rotate_one(fp, old_cipher, new_cipher) for fp in paths]
+
+    rotated = sum(results)
+    failed = len(results) - rotated
 
     # Update manifest fingerprint
     new_fp = hashlib.sha256(args.new_key.encode()).hexdigest()[:16]
@@ -0,0 +1,99 @@
+import hashlib
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from cryptography.fernet import Fernet
+
+from chats_archive import storage
+from chats_archive.index import MetadataIndex
+from chats_archive.storage import LocalEncryptedStore
+
+
+KEY = Fernet.generate_key()
+OTHER_KEY = Fernet.generate_key()
+
+
+def open_store(archive_dir, key=KEY):
+    with mock.patch.object(storage.EncryptionKeyManager, "get_or_create_key", return_value=key):
+        return LocalEncryptedStore(archive_dir)
+
+
+def bump_mtime(path: Path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class MetadataIndexVerifiedTests(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.archive_dir = self._tmpdir.name
+        store = open_store(self.archive_dir)
+        self.assertTrue(store.store_conversation({"title": "Hello"}, {"id": "conv-1"}))
+        self.wrapper_path = store.find_wrapper_path_for_conversation("conv-1")
+
+        # Verify once and persist the result, as an export run does
+        index = MetadataIndex(store)
+        self.assertTrue(index.has_valid_conversation("conv-1"))
+        index.save_verified()
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def test_unchanged_wrapper_skips_verification(self):
+        store = open_store(self.archive_dir)
+        with mock.patch.object(store, "has_valid_conversation") as full_check:
+            self.assertTrue(MetadataIndex(store).has_valid_conversation("conv-1"))
+        full_check.assert_not_called()
+
+    def test_rewritten_wrapper_is_verified_again(self):
+        wrapper = json.loads(self.wrapper_path.read_text())
+        wrapper["checksum"] = "0" * 64
+        self.wrapper_path.write_text(json.dumps(wrapper))
+        bump_mtime(self.wrapper_path)
+
+        store = open_store(self.archive_dir)
+        self.assertFalse(MetadataIndex(store).has_valid_conversation("conv-1"))
+
+    def test_changed_key_invalidates_verified_rows(self):
+        # A rotated manifest without re-encrypted wrappers: rows verified
+        # under the old key must not vouch for the new one
+        manifest_path = Path(self.archive_dir) / "ARCHIVE.json"
+        manifest = json.loads(manifest_path.read_text())
+        manifest["key_fingerprint"] = hashlib.sha256(OTHER_KEY).hexdigest()[:16]
+        manifest_path.write_text(json.dumps(manifest))
+
+        store = open_store(self.archive_dir, key=OTHER_KEY)
+        self.assertTrue(store.key_matches_manifest())
+        self.assertFalse(MetadataIndex(store).has_valid_conversation("conv-1"))
+
+    def test_manifest_mismatch_fails_closed(self):
+        manifest_path = Path(self.archive_dir) / "ARCHIVE.json"
+        manifest = json.loads(manifest_path.read_text())
+        manifest["key_fingerprint"] = "0" * 16
+        manifest_path.write_text(json.dumps(manifest))
+
+        store = open_store(self.archive_dir)
+        self.assertFalse(MetadataIndex(store).has_valid_conversation("conv-1"))
+
+
+class LookupFilterTests(unittest.TestCase):
+    def test_filter_uses_public_file_token(self):
+        with tempfile.TemporaryDirectory() as archive_dir:
+            store = open_store(archive_dir)
+            store.store_conversation({"title": "Hello"}, {"id": "conv-1"})
+            may_resolve = MetadataIndex(store).lookup_filter()
+
+            self.assertTrue(may_resolve("conv-1"))
+            self.assertFalse(may_resolve("unknown-conversation-id"))
+            self.assertEqual(
+                store.find_wrapper_path_for_conversation("conv-1").name,
+                f"conv-{store.file_token('conv-1')}.enc",
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -23,10 +23,92 @@ v3.0 Fixes:
 
 import re
 import math
-from dataclasses import dataclass, field
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Dict, List, Optional, Set, Tuple
 from enum import Enum
 
+try:  # Python 3.11+
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:
+    import sre_constants
+    import sre_parse
+
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator; see the "fast" extra
+    ahocorasick = None
+
+# Syllable heuristic patterns (see DiamondScorer._count_syllables)
+_SILENT_ENDING = re.compile(r'(?:[^laeiouy]es|ed|[^laeiouy]e)$')
+_LEADING_Y = re.compile(r'^y')
+_VOWEL_GROUP = re.compile(r'[aeiouy]{1,2}')
+
+# Lowercase characters that re.IGNORECASE would still match to an ASCII
+# letter ('ı' ~ 'i', 'ſ' ~ 's'). Folding them lets the all-lowercase phrase
+# patterns run case-sensitively with the same results.
+_IGNORECASE_FOLDS = str.maketrans({'\u0131': 'i', '\u017f': 's'})
+
+
+def _fold_lower(text_lower: str) -> str:
+    """Prepare lowercased text for the case-sensitive phrase patterns."""
+    if text_lower.isascii():
+        return text_lower
+    if '\u0131' in text_lower or '\u017f' in text_lower:
+        return text_lower.translate(_IGNORECASE_FOLDS)
+    return text_lower
+
+
+def _required_literals(pattern: str) -> Optional[Set[str]]:
+    """
+    Find literal strings at least one of which occurs in every match of a
+    case-sensitive pattern, e.g. {'cfg', 'guidance'} for
+    '(?:cfg|guidance) ?[0-9]+'. Returns None if there are none.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except re.error:
+        return None
+    if parsed.state.flags & sre_constants.SRE_FLAG_IGNORECASE:
+        return None
+    return _sequence_literals(parsed)
+
+
+def _sequence_literals(items) -> Optional[Set[str]]:
+    # Every item of a sequence is part of the match, so any one item's
+    # literals will do; keep the set whose shortest string is longest.
+    best = None
+    run = ''
+    
+    def offer(literals):
+        nonlocal best
+        if literals and (best is None or
+                         (min(map(len, literals)), -len(literals)) > (min(map(len, best)), -len(best))):
+            best = literals
+    
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            run += chr(av)
+            continue
+        offer({run} if run else None)
+        run = ''
+        if op is sre_constants.SUBPATTERN:
+            _, add_flags, _, sub = av
+            if not add_flags & sre_constants.SRE_FLAG_IGNORECASE:
+                offer(_sequence_literals(sub))
+        elif op is sre_constants.BRANCH:
+            # A branch needs literals in every alternative
+            branches = [_sequence_literals(b) for b in av[1]]
+            if all(branches):
+                offer(set().union(*branches))
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) and av[0] >= 1:
+            offer(_sequence_literals(av[2]))
+    offer({run} if run else None)
+    return best
+
 
 class QualityTier(Enum):
     DIAMOND = "💎 DIAMOND"
@@ -149,7 +231,8 @@ class DiamondScorer:
         silver_center: float = 4.0,
         threshold_softness: float = 2.0,  # Sigmoid steepness
         code_bonus: float = 3.0,
-        max_marker_repeats: int = 3  # Anti-gaming
+        max_marker_repeats: int = 3,  # Anti-gaming
+        cache_size: int = 4096  # Results kept for repeated texts (0 = off)
     ):
         self.TIER_CENTERS = {
             'diamond': diamond_center,
@@ -160,6 +243,14 @@ class DiamondScorer:
         self.code_bonus = code_bonus
         self.max_marker_repeats = max_marker_repeats
         
+        # (text, context) -> ScoringResult, least recently used first
+        self.cache_size = cache_size
+        self._cache: 'OrderedDict[Tuple[str, Optional[str]], ScoringResult]' = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # The cache may be shared across threads (see score_text)
+        self._cache_lock = threading.Lock()
+        
         self._build_term_sets()
         self._compile_patterns()
     
@@ -326,16 +417,19 @@ class DiamondScorer:
             # Quality boosters (common in prompts)
             r'\bhighly detailed\b', r'\bmaster(?:piece|work)\b',
             r'\baward[- ]?winning\b', r'\btrending on\b',
-            r'\bbeautiful\b.*\b(?:lighting|composition|colors?)\b',
+            # Scans stop at the next "beautiful", so a line of them is not
+            # rescanned from each one (matches the same texts as .*)
+            r'\bbeautiful\b(?:(?!\bbeautiful\b).)*\b(?:lighting|composition|colors?)\b',
             
             # Negative prompt indicators
             r'\bnegative prompt\b', r'\b(?:no|without|exclude)\s+(?:watermark|signature|text)\b',
             
-            # Model-specific terms
+            # Model-specific terms ("\s*(?:[:=]\s*)?" rather than "\s*[:=]?\s*",
+            # which backtracks quadratically over long runs of whitespace)
             r'\b(?:stable diffusion|midjourney|dall-?e|imagen)\b',
-            r'\b(?:cfg|guidance)[_\s]?(?:scale)?\s*[:=]?\s*\d+\b',
-            r'\b(?:steps|iterations)\s*[:=]?\s*\d+\b',
-            r'\bseed\s*[:=]?\s*\d+\b'
+            r'\b(?:cfg|guidance)[_\s]?(?:scale)?\s*(?:[:=]\s*)?\d+\b',
+            r'\b(?:steps|iterations)\s*(?:[:=]\s*)?\d+\b',
+            r'\bseed\s*(?:[:=]\s*)?\d+\b'
         ]
     
     def _compile_patterns(self):
@@ -356,9 +450,11 @@ class DiamondScorer:
         # Word pattern
         self.word_pattern = re.compile(r'\b\w+\b')
         
-        # Compile phrase patterns
+        # Compile phrase patterns. They are all lowercase and only ever see
+        # lowercased text (see _fold_lower), so no IGNORECASE: sre is much
+        # faster matching literals case-sensitively.
         def compile_phrases(phrases):
-            return [re.compile(p, re.IGNORECASE) for p in phrases]
+            return [re.compile(p) for p in phrases]
         
         self.explicit_patterns = compile_phrases(self.explicit_phrases)
         self.suggestive_patterns = compile_phrases(self.suggestive_phrases)
@@ -373,11 +469,120 @@ class DiamondScorer:
         self.legitimate_limitation_patterns = compile_phrases(self.legitimate_limitation_phrases)
         
         self.image_prompt_patterns = compile_phrases(self.image_prompt_phrases)
+        
+        # One alternation per category, searched before the individual
+        # patterns: if it finds nothing, no pattern in the category can match
+        def compile_any(phrases):
+            return re.compile('|'.join(f'(?:{p})' for p in phrases))
+        
+        self.explicit_any = compile_any(self.explicit_phrases)
+        self.suggestive_any = compile_any(self.suggestive_phrases)
+        self.mature_any = compile_any(self.mature_phrases)
+        self.safe_context_any = compile_any(self.safe_context_phrases)
+        self.frustration_any = compile_any(self.frustration_context)
+        
+        self.sentience_claim_any = compile_any(self.sentience_claim_phrases)
+        self.sentience_denial_any = compile_any(self.sentience_denial_phrases)
+        
+        self.refusal_any = compile_any(self.refusal_phrases)
+        self.legitimate_limitation_any = compile_any(self.legitimate_limitation_phrases)
+        
+        self.image_prompt_any = compile_any(self.image_prompt_phrases)
+        
+        self.phrase_automaton = self._build_phrase_automaton()
+    
+    def _build_phrase_automaton(self):
+        """
+        Index every phrase pattern under the literals it cannot match
+        without, in one Aho-Corasick automaton, so a single pass over the
+        text finds the patterns worth searching. Returns None when
+        pyahocorasick is not installed.
+        """
+        self.unanchored_patterns = set()
+        if ahocorasick is None:
+            return None
+        
+        by_literal = {}
+        for patterns in (
+            self.explicit_patterns, self.suggestive_patterns, self.mature_patterns,
+            self.safe_context_patterns, self.frustration_patterns,
+            self.sentience_claim_patterns, self.sentience_denial_patterns,
+            self.refusal_patterns, self.legitimate_limitation_patterns,
+            self.image_prompt_patterns
+        ):
+            for p in patterns:
+                literals = _required_literals(p.pattern)
+                if literals is None:
+                    self.unanchored_patterns.add(p)
+                    continue
+                for literal in literals:
+                    by_literal.setdefault(literal, []).append(p)
+        
+        automaton = ahocorasick.Automaton()
+        for literal, patterns in by_literal.items():
+            automaton.add_word(literal, tuple(patterns))
+        automaton.make_automaton()
+        return automaton
+    
+    def _candidate_patterns(self, text: str) -> Optional[Set[re.Pattern]]:
+        """Phrase patterns that may match text, or None without the automaton."""
+        if self.phrase_automaton is None:
+            return None
+        candidates = set(self.unanchored_patterns)
+        for _, patterns in self.phrase_automaton.iter(text):
+            candidates.update(patterns)
+        return candidates
+    
+    @staticmethod
+    def _matching_patterns(
+        any_pattern: re.Pattern,
+        patterns: List[re.Pattern],
+        text: str,
+        limit: Optional[int] = None,
+        candidates: Optional[Set[re.Pattern]] = None
+    ) -> List[re.Pattern]:
+        """
+        Return the patterns that match text.
+        
+        Only patterns in candidates (see _candidate_patterns) are searched
+        when it is given; otherwise the category's alternation is searched
+        first. With a limit, stops once that many patterns have matched.
+        """
+        if candidates is not None:
+            patterns = [p for p in patterns if p in candidates]
+            start = 0
+        else:
+            first = any_pattern.search(text)
+            if first is None:
+                return []
+            # No pattern can match before the alternation's leftmost match
+            start = first.start()
+        matched = []
+        for p in patterns:
+            if p.search(text, start):
+                matched.append(p)
+                if len(matched) == limit:
+                    break
+        return matched
+    
+    @staticmethod
+    def _count_matches(
+        any_pattern: re.Pattern,
+        patterns: List[re.Pattern],
+        text: str,
+        limit: Optional[int] = None,
+        candidates: Optional[Set[re.Pattern]] = None
+    ) -> int:
+        """Count the patterns that match text (see _matching_patterns)."""
+        return len(DiamondScorer._matching_patterns(any_pattern, patterns, text, limit, candidates))
     
     def evaluate(self, text: str, context: Optional[str] = None) -> ScoringResult:
         """
         Evaluate text across all dimensions.
         
+        Results for repeated (text, context) pairs come from an LRU cache;
+        each call still gets its own copy.
+        
         Args:
             text: The text to evaluate
             context: Optional surrounding context
@@ -385,6 +590,55 @@ class DiamondScorer:
         Returns:
             ScoringResult with quality, content, and behavior assessments
         """
+        if self.cache_size <= 0:
+            return self._evaluate(text, context)
+        
+        key = (text, context)
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                self._cache_hits += 1
+        if result is None:
+            result = self._evaluate(text, context)
+            with self._cache_lock:
+                self._cache[key] = result
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+                self._cache_misses += 1
+        return self._copy_result(result)
+    
+    @staticmethod
+    def _copy_result(result: ScoringResult) -> ScoringResult:
+        """Copy a result so callers cannot alter the cached one."""
+        return replace(
+            result,
+            behavior_flags=list(result.behavior_flags),
+            quality_signals=dict(result.quality_signals),
+            content_signals=dict(result.content_signals),
+            behavior_signals=dict(result.behavior_signals),
+            code_languages=list(result.code_languages),
+            warnings=list(result.warnings)
+        )
+    
+    def cache_info(self) -> Dict:
+        """Hit/miss counts and size of the evaluate cache."""
+        return {
+            'hits': self._cache_hits,
+            'misses': self._cache_misses,
+            'size': len(self._cache),
+            'maxsize': self.cache_size
+        }
+    
+    def clear_cache(self):
+        """Drop all cached evaluate results."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
+    
+    def _evaluate(self, text: str, context: Optional[str]) -> ScoringResult:
+        """Uncached evaluate."""
         warnings = []
         
         if not text or not text.strip():
@@ -414,14 +668,19 @@ class DiamondScorer:
             text, text_lower, text_without_code, words, has_code
         )
         
+        # Phrase patterns run on folded text; candidates is None without
+        # the automaton
+        phrase_text = _fold_lower(text_lower)
+        candidates = self._candidate_patterns(phrase_text)
+        
         # === CONTENT SCORING ===
         content_score, content_signals, content_conf = self._score_content(
-            text, text_lower, context
+            text, phrase_text, context, candidates
         )
         
         # === BEHAVIOR DETECTION ===
         behavior_flags, behavior_signals, sentience_score, refusal_score, image_score = \
-            self._detect_behaviors(text, text_lower)
+            self._detect_behaviors(text, phrase_text, candidates)
         
         # Determine tiers with soft thresholds
         tier, tier_conf = self._score_to_tier(quality_score)
@@ -465,29 +724,32 @@ class DiamondScorer:
         has_code = bool(self.code_block_pattern.search(text))
         
         # Strip code for readability analysis
-        text_without_code = self.code_block_pattern.sub(' ', text)
+        text_without_code = self.code_block_pattern.sub(' ', text) if has_code else text
         
         return has_code, languages, text_without_code
     
-    def _count_syllables(self, word: str) -> int:
-        """Heuristic syllable counter."""
+    @staticmethod
+    @lru_cache(maxsize=1 << 16)
+    def _count_syllables(word: str) -> int:
+        """Heuristic syllable counter (cached, since words repeat heavily)."""
         word = word.lower()
         if len(word) <= 3:
             return 1
         
         # Remove common silent endings
-        word = re.sub(r'(?:[^laeiouy]es|ed|[^laeiouy]e)$', '', word)
-        word = re.sub(r'^y', '', word)
+        word = _SILENT_ENDING.sub('', word)
+        word = _LEADING_Y.sub('', word)
         
-        syllables = re.findall(r'[aeiouy]{1,2}', word)
+        syllables = _VOWEL_GROUP.findall(word)
         return max(1, len(syllables))
     
-    def _flesch_kincaid(self, text: str) -> float:
+    def _flesch_kincaid(self, text: str, words: Optional[List[str]] = None) -> float:
         """Calculate Flesch-Kincaid grade level."""
         sentences = [s for s in self.sentence_pattern.split(text) if s.strip()]
         sentence_count = max(1, len(sentences))
         
-        words = self.word_pattern.findall(text)
+        if words is None:
+            words = self.word_pattern.findall(text)
         word_count = len(words)
         
         if word_count == 0:
@@ -522,12 +784,11 @@ class DiamondScorer:
         marker_counts = {}
         total_markers = 0
         
+        word_counts = Counter(map(str.lower, words))
+        
         for marker in self.reasoning_markers:
-            # Check for phrase markers
-            if ' ' in marker:
-                count = len(re.findall(re.escape(marker), text_lower))
-            else:
-                count = sum(1 for w in words if w.lower() == marker)
+            # Phrase markers are plain substrings; single words come from the word list
+            count = text_lower.count(marker) if ' ' in marker else word_counts[marker]
             
             if count > 0:
                 # Cap repeats of same marker (anti-gaming)
@@ -560,12 +821,13 @@ class DiamondScorer:
         signals['marker_diversity'] = unique_markers
         
         # 2. Complexity (Flesch-Kincaid on non-code text)
-        complexity = self._flesch_kincaid(text_without_code)
+        # Without code blocks there is nothing stripped, so reuse the words
+        complexity = self._flesch_kincaid(text_without_code, None if has_code else words)
         complexity = max(0, min(20, complexity))  # Clamp to reasonable range
         signals['complexity'] = complexity
         
         # 2b. Repetition penalty (anti-gaming for repetitive text)
-        unique_words = len(set(w.lower() for w in words))
+        unique_words = len(word_counts)
         word_count = len(words)
         repetition_ratio = unique_words / word_count if word_count > 0 else 1
         
@@ -607,7 +869,8 @@ class DiamondScorer:
         self, 
         text: str, 
         text_lower: str, 
-        context: Optional[str]
+        context: Optional[str],
+        candidates: Optional[Set[re.Pattern]] = None
     ) -> Tuple[float, Dict[str, float], float]:
         """
         Score content for NSFW/mature classification.
@@ -617,12 +880,18 @@ class DiamondScorer:
         signals = {}
         confidence = 1.0
         
-        # Count pattern matches
-        explicit_hits = sum(1 for p in self.explicit_patterns if p.search(text_lower))
-        suggestive_hits = sum(1 for p in self.suggestive_patterns if p.search(text_lower))
-        mature_hits = sum(1 for p in self.mature_patterns if p.search(text_lower))
-        safe_hits = sum(1 for p in self.safe_context_patterns if p.search(text_lower))
-        frustration_hits = sum(1 for p in self.frustration_patterns if p.search(text_lower))
+        def matching(any_pattern, patterns):
+            return self._matching_patterns(any_pattern, patterns, text_lower, candidates=candidates)
+        
+        # Count pattern matches (keeping the matched patterns for proximity)
+        explicit_matched = matching(self.explicit_any, self.explicit_patterns)
+        suggestive_matched = matching(self.suggestive_any, self.suggestive_patterns)
+        safe_matched = matching(self.safe_context_any, self.safe_context_patterns)
+        explicit_hits = len(explicit_matched)
+        suggestive_hits = len(suggestive_matched)
+        mature_hits = len(matching(self.mature_any, self.mature_patterns))
+        safe_hits = len(safe_matched)
+        frustration_hits = len(matching(self.frustration_any, self.frustration_patterns))
         
         signals['explicit_matches'] = explicit_hits
         signals['suggestive_matches'] = suggestive_hits
@@ -652,11 +921,12 @@ class DiamondScorer:
         
         # Window check: safe terms must be NEAR flagged terms
         if safe_hits > 0 and (explicit_hits > 0 or suggestive_hits > 0):
-            # Check proximity (within 50 chars)
+            # Check proximity (within 50 chars); patterns that did not
+            # match have no positions to contribute
             proximity_valid = self._check_proximity(
                 text_lower, 
-                self.safe_context_patterns, 
-                self.explicit_patterns + self.suggestive_patterns,
+                safe_matched, 
+                explicit_matched + suggestive_matched,
                 window=50
             )
             if not proximity_valid:
@@ -667,8 +937,12 @@ class DiamondScorer:
         
         # Context from surrounding text
         if context:
-            context_lower = context.lower()
-            context_safe = sum(1 for p in self.safe_context_patterns if p.search(context_lower))
+            context_lower = _fold_lower(context.lower())
+            # Only the count up to 3 matters: the reduction caps at 15
+            context_safe = self._count_matches(
+                self.safe_context_any, self.safe_context_patterns, context_lower, limit=3,
+                candidates=self._candidate_patterns(context_lower)
+            )
             if context_safe >= 2:
                 score -= min(15, context_safe * 5)
                 signals['context_safe_reduction'] = -min(15, context_safe * 5)
@@ -696,17 +970,24 @@ class DiamondScorer:
             for m in p.finditer(text):
                 positions_b.append(m.start())
         
-        for pos_a in positions_a:
-            for pos_b in positions_b:
-                if abs(pos_a - pos_b) <= window:
-                    return True
+        # Sweep the merged positions in order: the closest earlier match of
+        # the other kind is the only one each position needs checking against
+        events = [(pos, 0) for pos in positions_a] + [(pos, 1) for pos in positions_b]
+        events.sort()
+        last = [None, None]
+        for pos, kind in events:
+            other = last[1 - kind]
+            if other is not None and pos - other <= window:
+                return True
+            last[kind] = pos
         
         return False
     
     def _detect_behaviors(
         self, 
         text: str, 
-        text_lower: str
+        text_lower: str,
+        candidates: Optional[Set[re.Pattern]] = None
     ) -> Tuple[List[BehaviorFlag], Dict[str, float], float, float, float]:
         """
         Detect behavioral patterns: sentience claims, refusals, image prompts.
@@ -714,9 +995,12 @@ class DiamondScorer:
         flags = []
         signals = {}
         
+        def count_hits(any_pattern, patterns):
+            return self._count_matches(any_pattern, patterns, text_lower, candidates=candidates)
+        
         # === SENTIENCE DETECTION (with negation handling) ===
-        claim_hits = sum(1 for p in self.sentience_claim_patterns if p.search(text_lower))
-        denial_hits = sum(1 for p in self.sentience_denial_patterns if p.search(text_lower))
+        claim_hits = count_hits(self.sentience_claim_any, self.sentience_claim_patterns)
+        denial_hits = count_hits(self.sentience_denial_any, self.sentience_denial_patterns)
         
         signals['sentience_claims'] = claim_hits
         signals['sentience_denials'] = denial_hits
@@ -728,8 +1012,8 @@ class DiamondScorer:
             flags.append(BehaviorFlag.SENTIENCE_CLAIM)
         
         # === REFUSAL DETECTION (with legitimate limitation handling) ===
-        refusal_hits = sum(1 for p in self.refusal_patterns if p.search(text_lower))
-        legit_hits = sum(1 for p in self.legitimate_limitation_patterns if p.search(text_lower))
+        refusal_hits = count_hits(self.refusal_any, self.refusal_patterns)
+        legit_hits = count_hits(self.legitimate_limitation_any, self.legitimate_limitation_patterns)
         
         signals['refusal_matches'] = refusal_hits
         signals['legitimate_limitations'] = legit_hits
@@ -741,7 +1025,7 @@ class DiamondScorer:
             flags.append(BehaviorFlag.REFUSAL)
         
         # === IMAGE PROMPT DETECTION ===
-        image_hits = sum(1 for p in self.image_prompt_patterns if p.search(text_lower))
+        image_hits = count_hits(self.image_prompt_any, self.image_prompt_patterns)
         signals['image_prompt_matches'] = image_hits
         
         image_score = min(100, image_hits * 10)
@@ -753,46 +1037,57 @@ class DiamondScorer:
     
     def _sigmoid(self, x: float, center: float, steepness: float = 1.0) -> float:
         """Sigmoid function for soft thresholds."""
-        return 1 / (1 + math.exp(-steepness * (x - center)))
+        try:
+            return 1 / (1 + math.exp(-steepness * (x - center)))
+        except OverflowError:
+            # Far below a steep threshold: the limit of the expression above
+            return 0.0
+    
+    # A sigmoid above is at most 0.5 wherever steepness * (score - center)
+    # <= 0, so tiers the score is not above are ruled out without
+    # evaluating it; only the sigmoids the confidence needs are computed.
     
     def _score_to_tier(self, score: float) -> Tuple[QualityTier, float]:
         """Convert score to tier with soft boundaries and confidence."""
-        
-        # Calculate probability of each tier
-        p_diamond = self._sigmoid(score, self.TIER_CENTERS['diamond'], self.threshold_softness)
-        p_gold = self._sigmoid(score, self.TIER_CENTERS['gold'], self.threshold_softness)
-        p_silver = self._sigmoid(score, self.TIER_CENTERS['silver'], self.threshold_softness)
-        
-        # Determine tier and confidence
-        if p_diamond > 0.5:
-            confidence = p_diamond
-            return QualityTier.DIAMOND, confidence
-        elif p_gold > 0.5:
-            # Confidence is how far from the boundaries
-            confidence = min(p_gold, 1 - p_diamond)
-            return QualityTier.GOLD, confidence
-        elif p_silver > 0.5:
-            confidence = min(p_silver, 1 - p_gold)
-            return QualityTier.SILVER, confidence
-        else:
-            confidence = 1 - p_silver
-            return QualityTier.BRONZE, confidence
+        steepness = self.threshold_softness
+        diamond = self.TIER_CENTERS['diamond']
+        gold = self.TIER_CENTERS['gold']
+        silver = self.TIER_CENTERS['silver']
+        
+        if steepness * (score - diamond) > 0:
+            p_diamond = self._sigmoid(score, diamond, steepness)
+            if p_diamond > 0.5:
+                return QualityTier.DIAMOND, p_diamond
+        if steepness * (score - gold) > 0:
+            p_gold = self._sigmoid(score, gold, steepness)
+            if p_gold > 0.5:
+                # Confidence is how far from the boundaries
+                return QualityTier.GOLD, min(p_gold, 1 - self._sigmoid(score, diamond, steepness))
+        if steepness * (score - silver) > 0:
+            p_silver = self._sigmoid(score, silver, steepness)
+            if p_silver > 0.5:
+                return QualityTier.SILVER, min(p_silver, 1 - self._sigmoid(score, gold, steepness))
+        return QualityTier.BRONZE, 1 - self._sigmoid(score, silver, steepness)
     
     def _score_to_rating(self, score: float) -> Tuple[ContentRating, float]:
         """Convert content score to rating with confidence."""
-        
-        p_explicit = self._sigmoid(score, self.CONTENT_CENTERS['explicit'], 0.1)
-        p_suggestive = self._sigmoid(score, self.CONTENT_CENTERS['suggestive'], 0.1)
-        p_mature = self._sigmoid(score, self.CONTENT_CENTERS['mature'], 0.1)
-        
-        if p_explicit > 0.5:
-            return ContentRating.EXPLICIT, p_explicit
-        elif p_suggestive > 0.5:
-            return ContentRating.SUGGESTIVE, min(p_suggestive, 1 - p_explicit)
-        elif p_mature > 0.5:
-            return ContentRating.MATURE, min(p_mature, 1 - p_suggestive)
-        else:
-            return ContentRating.CLEAN, 1 - p_mature
+        explicit = self.CONTENT_CENTERS['explicit']
+        suggestive = self.CONTENT_CENTERS['suggestive']
+        mature = self.CONTENT_CENTERS['mature']
+        
+        if score > explicit:
+            p_explicit = self._sigmoid(score, explicit, 0.1)
+            if p_explicit > 0.5:
+                return ContentRating.EXPLICIT, p_explicit
+        if score > suggestive:
+            p_suggestive = self._sigmoid(score, suggestive, 0.1)
+            if p_suggestive > 0.5:
+                return ContentRating.SUGGESTIVE, min(p_suggestive, 1 - self._sigmoid(score, explicit, 0.1))
+        if score > mature:
+            p_mature = self._sigmoid(score, mature, 0.1)
+            if p_mature > 0.5:
+                return ContentRating.MATURE, min(p_mature, 1 - self._sigmoid(score, suggestive, 0.1))
+        return ContentRating.CLEAN, 1 - self._sigmoid(score, mature, 0.1)
     
     def evaluate_pair(
         self, 
@@ -805,26 +1100,97 @@ class DiamondScorer:
     def evaluate_batch(
         self, 
         texts: List[str],
-        contexts: Optional[List[str]] = None
+        contexts: Optional[List[str]] = None,
+        workers: int = 1,
+        executor: Optional[ProcessPoolExecutor] = None
     ) -> List[ScoringResult]:
-        """Evaluate multiple texts."""
+        """
+        Evaluate multiple texts, across worker processes if workers > 1.
+
+        executor may be a pool from worker_pool() to reuse across calls;
+        it is used in place of a new pool of workers processes.
+        """
         if contexts is None:
             contexts = [None] * len(texts)
         
+        if executor is not None or workers > 1:
+            # Texts are independent and scoring is CPU-bound regex work;
+            # each worker gets a copy of this scorer (without its cache).
+            # Workers do not share a cache, so duplicates are scored once
+            # here and sent to no worker.
+            items = list(zip(texts, contexts))
+            unique = list(dict.fromkeys(items))
+            if executor is None:
+                with self.worker_pool(workers) as pool:
+                    scored = dict(zip(unique, pool.map(_evaluate_in_worker, unique, chunksize=64)))
+            else:
+                scored = dict(zip(unique, executor.map(_evaluate_in_worker, unique, chunksize=64)))
+            if len(unique) == len(items):
+                return [scored[item] for item in items]
+            return [self._copy_result(scored[item]) for item in items]
+        
         return [self.evaluate(t, c) for t, c in zip(texts, contexts)]
+    
+    def worker_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Start a pool of workers processes, each holding a copy of this scorer."""
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self,)
+        )
+    
+    def __getstate__(self):
+        # Cached results stay with this instance when it is pickled
+        state = self.__dict__.copy()
+        state['_cache'] = OrderedDict()
+        state['_cache_hits'] = 0
+        state['_cache_misses'] = 0
+        del state['_cache_lock']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
+
+
+# Scorer used by evaluate_batch worker processes
+_worker_scorer = None
+
+
+def _init_worker(scorer: DiamondScorer):
+    global _worker_scorer
+    _worker_scorer = scorer
+
+
+def _evaluate_in_worker(item: Tuple[str, Optional[str]]) -> ScoringResult:
+    return _worker_scorer.evaluate(*item)
 
 
 # === CONVENIENCE FUNCTIONS ===
 
+_default_scorer: Optional[DiamondScorer] = None
+_default_scorer_lock = threading.Lock()
+
+
+def _get_default_scorer() -> DiamondScorer:
+    """Shared scorer for the convenience functions, built on first use."""
+    global _default_scorer
+    if _default_scorer is None:
+        with _default_scorer_lock:
+            if _default_scorer is None:
+                _default_scorer = DiamondScorer()
+    return _default_scorer
+
+
 def score_text(text: str) -> Dict:
     """Quick scoring function."""
-    scorer = DiamondScorer()
+    scorer = _get_default_scorer()
     return scorer.evaluate(text).to_dict()
 
 
 def score_and_tag(record: Dict, text_field: str = 'text') -> Dict:
     """Score a record and add tags in-place."""
-    scorer = DiamondScorer()
+    scorer = _get_default_scorer()
     text = record.get(text_field, '')
     result = scorer.evaluate(text)
     record.update(result.to_tags())
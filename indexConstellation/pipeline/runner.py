@@ -14,88 +14,189 @@ import argparse
 import json
 import sys
 import os
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-# Add package paths
-SUITE_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(SUITE_ROOT / "packages" / "ndrp"))
-sys.path.insert(0, str(SUITE_ROOT / "packages" / "scorer"))
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; see the "fast" extra
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# JSONL output is written through one large binary buffer, one write per entry
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Entries scored per evaluate_batch call while streaming through stage_score
+SCORE_BATCH_SIZE = 4096
+
+# Most text scored for an entry without a content, response or text field
+FALLBACK_TEXT_CHARS = 8192
+
+# Add package paths (once, even if this module is imported as a library)
+SUITE_ROOT = Path(__file__).resolve().parent.parent
+for _package_dir in (SUITE_ROOT / "packages" / "ixc-core-ndrp", SUITE_ROOT / "packages" / "ixc-vector"):
+    if str(_package_dir) not in sys.path:
+        sys.path.insert(0, str(_package_dir))
+
+# JSONL lines are serialized the same way as scripts/run_pipeline.py writes them
+from standardization.serialize import dumps_line
+
+# Stage dependencies are imported once here; a stage that needs a missing
+# one reports the import error when it is set up.
+try:
+    from extraction.extractor import extract_entries_as_dicts
+    from standardization.rewrite import to_ndrp_entry
+    from enhancement.enhance import enhance_entry
+    _ndrp_import_error = None
+except ImportError as e:
+    extract_entries_as_dicts = to_ndrp_entry = enhance_entry = None
+    _ndrp_import_error = e
+
+try:
+    from validator.validate import validate_entry
+    from validator.aggregation import aggregate_validator_results
+    _validator_import_error = None
+except ImportError as e:
+    validate_entry = aggregate_validator_results = None
+    _validator_import_error = e
+
+try:
+    from diamond_scorer_v3 import DiamondScorer
+    _scorer_import_error = None
+except ImportError as e:
+    DiamondScorer = None
+    _scorer_import_error = e
 
 
 def load_input(input_path: Path) -> List[Dict[str, Any]]:
     """Load JSON or JSONL input."""
+    return list(iter_input(input_path))
+
+
+def iter_input(input_path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield entries from JSON or JSONL input.
+
+    JSONL is parsed line by line as the file is read; anything else (a
+    single JSON document, however many lines it spans) is parsed whole.
+    A missing file is reported here, before any entry is requested.
+    """
     if not input_path.exists():
         print(f"Error: Input file not found: {input_path}", file=sys.stderr)
         sys.exit(1)
+    return _iter_entries(input_path)
+
+
+def _iter_entries(input_path: Path) -> Iterator[Dict[str, Any]]:
+    with input_path.open("rb") as f:
+        line_no = 0
+        line = f.readline()
+        while line and not line.strip():
+            line_no += 1
+            line = f.readline()
+        line_no += 1
+
+        # A complete JSON value on the first line with more content after
+        # it can only be JSONL: parsing the whole file would fail
+        try:
+            first = _json_loads(line)
+        except json.JSONDecodeError:
+            first = _NOT_PARSED
+        if first is not _NOT_PARSED and _has_more_content(f):
+            yield first
+            yield from _iter_jsonl(f, line_no)
+            return
+        if first is not _NOT_PARSED:
+            yield from _document_entries(first)
+            return
+
+        # Try JSON first
+        f.seek(0)
+        try:
+            parsed = _json_loads(f.read())
+        except json.JSONDecodeError:
+            pass
+        else:
+            yield from _document_entries(parsed)
+            return
 
-    with input_path.open("r", encoding="utf-8") as f:
-        content = f.read()
+        # Try JSONL
+        f.seek(0)
+        yield from _iter_jsonl(f, 0)
 
-    # Try JSON first
+
+_NOT_PARSED = object()
+
+
+def _has_more_content(f) -> bool:
+    """True if anything but whitespace follows; leaves f where it was."""
+    pos = f.tell()
     try:
-        parsed = json.loads(content)
-        if isinstance(parsed, list):
-            return parsed
-        if isinstance(parsed, dict):
-            # ChatGPT export format or single entry
-            if "mapping" in parsed or "conversations" in parsed:
-                return [parsed]
-            return [parsed]
-        return [parsed]
-    except json.JSONDecodeError:
-        pass
-
-    # Try JSONL
-    entries = []
-    for line_no, line in enumerate(content.splitlines(), start=1):
+        while True:
+            chunk = f.read(1 << 16)
+            if not chunk:
+                return False
+            if chunk.strip():
+                return True
+    finally:
+        f.seek(pos)
+
+
+def _document_entries(parsed: Any) -> List[Any]:
+    if isinstance(parsed, list):
+        return parsed
+    # ChatGPT export format, single entry or a bare value
+    return [parsed]
+
+
+def _iter_jsonl(f, line_no: int) -> Iterator[Any]:
+    for line_no, line in enumerate(f, start=line_no + 1):
         line = line.strip()
         if not line:
             continue
         try:
-            entries.append(json.loads(line))
+            yield _json_loads(line)
         except json.JSONDecodeError as e:
             print(f"Warning: Invalid JSON on line {line_no}: {e}", file=sys.stderr)
-    return entries
 
 
-def stage_normalize(entries: List[Dict[str, Any]], source: str = "pipeline") -> List[Dict[str, Any]]:
-    """Run NDRP normalization: extract → classify → standardize."""
-    try:
-        from extraction.extractor import extract_entries_as_dicts
-        from standardization.rewrite import to_ndrp_entry
-        from enhancement.enhance import enhance_entry
-    except ImportError as e:
-        print(f"Error: Could not import NDRP modules: {e}", file=sys.stderr)
+def stage_normalize(entries: Iterable[Dict[str, Any]], source: str = "pipeline") -> Iterator[Dict[str, Any]]:
+    """
+    Run NDRP normalization: extract → classify → standardize.
+
+    Entries are normalized lazily as the returned iterator is consumed.
+    """
+    if _ndrp_import_error is not None:
+        print(f"Error: Could not import NDRP modules: {_ndrp_import_error}", file=sys.stderr)
         print("Ensure packages/ixc-core-ndrp is in the Python path.", file=sys.stderr)
         sys.exit(1)
 
-    normalized = []
-    for entry in entries:
-        # If entry already has 'content', extract from that
-        content = entry.get("content", "")
-        if not content and entry.get("text"):
-            content = entry["text"]
-        if not content:
-            content = json.dumps(entry)
+    def normalize() -> Iterator[Dict[str, Any]]:
+        for entry in entries:
+            # If entry already has 'content', extract from that
+            content = entry.get("content", "")
+            if not content and entry.get("text"):
+                content = entry["text"]
+            if not content:
+                content = json.dumps(entry)
 
-        # Run through NDRP stages
-        lines = content.splitlines() if content else [""]
-        for pre_entry in extract_entries_as_dicts(lines, source=source):
-            ndrp_entry = to_ndrp_entry(pre_entry)
-            enhanced = enhance_entry(ndrp_entry)
-            normalized.append(enhanced)
+            # Run through NDRP stages
+            lines = content.splitlines() if content else [""]
+            for pre_entry in extract_entries_as_dicts(lines, source=source):
+                ndrp_entry = to_ndrp_entry(pre_entry)
+                yield enhance_entry(ndrp_entry)
 
-    return normalized
+    return normalize()
 
 
 def stage_validate(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Run NDRP validation and hygiene scoring."""
-    try:
-        from validator.validate import validate_entry
-        from validator.aggregation import aggregate_validator_results
-    except ImportError as e:
-        print(f"Error: Could not import NDRP validator: {e}", file=sys.stderr)
+    if _validator_import_error is not None:
+        print(f"Error: Could not import NDRP validator: {_validator_import_error}", file=sys.stderr)
         sys.exit(1)
 
     findings = []
@@ -119,146 +220,259 @@ def stage_validate(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
-def stage_score(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Run DiamondScorer v3.0 quality scoring."""
-    try:
-        from diamond_scorer_v3 import DiamondScorer
-    except ImportError as e:
-        print(f"Error: Could not import DiamondScorer: {e}", file=sys.stderr)
+def stage_score(entries: Iterable[Dict[str, Any]], workers: int = 1) -> Iterator[Dict[str, Any]]:
+    """
+    Run DiamondScorer v3.0 quality scoring.
+
+    Entries are scored lazily, SCORE_BATCH_SIZE at a time, as the returned
+    iterator is consumed. With workers > 1 each batch is scored in that
+    many worker processes (see DiamondScorer.evaluate_batch), one pool
+    shared by all batches; results keep the input order.
+    """
+    if _scorer_import_error is not None:
+        print(f"Error: Could not import DiamondScorer: {_scorer_import_error}", file=sys.stderr)
         print("Ensure packages/ixc-vector is in the Python path.", file=sys.stderr)
         sys.exit(1)
 
     scorer = DiamondScorer()
-    scored = []
-
-    for entry in entries:
-        # Score the content field (or full text)
-        text = entry.get("content", "") or entry.get("response", "") or entry.get("text", "")
-        if not text:
-            text = json.dumps(entry)
 
-        result = scorer.score(text)
-
-        # Merge scoring results into entry
-        scored_entry = dict(entry)
-        scored_entry["ixc_scoring"] = result.to_dict()
-        scored_entry["ixc_tier"] = result.tier.value
-        scored_entry["ixc_quality_score"] = round(result.quality_score, 2)
-        scored_entry["ixc_content_rating"] = result.content_rating.value
-        scored_entry["ixc_behavior_flags"] = [f.value for f in result.behavior_flags]
-        scored.append(scored_entry)
-
-    return scored
+    def score_batch(batch: List[Dict[str, Any]], executor) -> Iterator[Dict[str, Any]]:
+        texts = []
+        for entry in batch:
+            # Score the content field (or full text)
+            text = entry.get("content", "") or entry.get("response", "") or entry.get("text", "")
+            if not text:
+                text = _entry_to_text(entry)
+            texts.append(text)
+
+        results = scorer.evaluate_batch(texts, executor=executor)
+
+        for entry, result in zip(batch, results):
+            # Merge scoring results into entry
+            scored_entry = dict(entry)
+            scored_entry["ixc_scoring"] = result.to_dict()
+            scored_entry["ixc_tier"] = result.tier.value
+            scored_entry["ixc_quality_score"] = round(result.quality_score, 2)
+            scored_entry["ixc_content_rating"] = result.content_rating.value
+            scored_entry["ixc_behavior_flags"] = [f.value for f in result.behavior_flags]
+            yield scored_entry
+
+    def score() -> Iterator[Dict[str, Any]]:
+        with scorer.worker_pool(workers) if workers > 1 else nullcontext() as executor:
+            batch = []
+            for entry in entries:
+                batch.append(entry)
+                if len(batch) == SCORE_BATCH_SIZE:
+                    yield from score_batch(batch, executor)
+                    batch = []
+            if batch:
+                yield from score_batch(batch, executor)
+
+    return score()
+
+
+def _entry_to_text(entry: Any, max_chars: int = FALLBACK_TEXT_CHARS) -> str:
+    """
+    Text to score for an entry with no content, response or text field:
+    its string values, depth first in field order, up to max_chars.
+
+    Unlike json.dumps(entry), this never serializes the whole entry (which
+    may carry large embedded media) and leaves out JSON syntax and keys.
+    An entry with no string values gives "", which scores as empty.
+    """
+    parts = []
+    remaining = max_chars
+    stack = [entry]
+    while stack and remaining > 0:
+        value = stack.pop()
+        if isinstance(value, str):
+            if value:
+                part = value[:remaining]
+                parts.append(part)
+                remaining -= len(part)
+        elif isinstance(value, dict):
+            stack.extend(reversed(list(value.values())))
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+    return "\n".join(parts)
 
 
 def stage_filter(
-    entries: List[Dict[str, Any]],
+    entries: Iterable[Dict[str, Any]],
     min_tier: Optional[str] = None,
     min_hygiene: Optional[int] = None,
     exclude_flags: Optional[List[str]] = None,
     content_rating_max: Optional[str] = None,
-) -> List[Dict[str, Any]]:
-    """Filter entries based on scoring thresholds."""
+) -> Iterator[Dict[str, Any]]:
+    """Filter entries based on scoring thresholds, lazily."""
     tier_rank = {"💎 DIAMOND": 4, "🥇 GOLD": 3, "🥈 SILVER": 2, "🥉 BRONZE": 1}
     tier_names = {"diamond": "💎 DIAMOND", "gold": "🥇 GOLD", "silver": "🥈 SILVER", "bronze": "🥉 BRONZE"}
     rating_rank = {"✨ CLEAN": 1, "⚠️ MATURE": 2, "🌶️ SUGGESTIVE": 3, "🔥 EXPLICIT": 4}
     rating_names = {"clean": "✨ CLEAN", "mature": "⚠️ MATURE", "suggestive": "🌶️ SUGGESTIVE", "explicit": "🔥 EXPLICIT"}
 
-    filtered = []
-    for entry in entries:
+    # Thresholds are resolved once, not per entry
+    min_tier_rank = None
+    if min_tier:
+        min_tier_rank = tier_rank.get(tier_names.get(min_tier.lower(), min_tier), 0)
+    max_rating_rank = None
+    if content_rating_max:
+        max_rating_rank = rating_rank.get(rating_names.get(content_rating_max.lower(), content_rating_max), 0)
+    exclude_lower = [flag.lower() for flag in exclude_flags] if exclude_flags else None
+
+    def keep(entry: Dict[str, Any]) -> bool:
         # Tier filter
-        if min_tier:
-            entry_tier = entry.get("ixc_tier", "🥉 BRONZE")
-            min_tier_full = tier_names.get(min_tier.lower(), min_tier)
-            if tier_rank.get(entry_tier, 0) < tier_rank.get(min_tier_full, 0):
-                continue
+        if min_tier_rank is not None:
+            if tier_rank.get(entry.get("ixc_tier", "🥉 BRONZE"), 0) < min_tier_rank:
+                return False
 
         # Flag exclusion
-        if exclude_flags:
-            entry_flags = entry.get("ixc_behavior_flags", [])
-            flag_match = False
-            for flag in exclude_flags:
-                for ef in entry_flags:
-                    if flag.lower() in ef.lower():
-                        flag_match = True
-                        break
-            if flag_match:
-                continue
+        if exclude_lower:
+            entry_flags = [ef.lower() for ef in entry.get("ixc_behavior_flags", [])]
+            if any(flag in ef for flag in exclude_lower for ef in entry_flags):
+                return False
 
         # Content rating filter
-        if content_rating_max:
-            entry_rating = entry.get("ixc_content_rating", "✨ CLEAN")
-            max_rating_full = rating_names.get(content_rating_max.lower(), content_rating_max)
-            if rating_rank.get(entry_rating, 0) > rating_rank.get(max_rating_full, 0):
-                continue
+        if max_rating_rank is not None:
+            if rating_rank.get(entry.get("ixc_content_rating", "✨ CLEAN"), 0) > max_rating_rank:
+                return False
 
-        filtered.append(entry)
+        return True
 
-    return filtered
+    return filter(keep, entries)
 
 
-def stage_export(entries: List[Dict[str, Any]], fmt: str) -> List[Dict[str, Any]]:
-    """Convert entries to training format."""
-    exported = []
+def _to_anthropic(prompt: str, response: Any) -> Dict[str, Any]:
+    return {
+        "messages": [
+            {"role": "user", "content": prompt},
+            {"role": "assistant", "content": response},
+        ]
+    }
 
-    for entry in entries:
-        content = entry.get("content", "")
-        instruction = entry.get("instruction", entry.get("intent", ""))
-        response = entry.get("response", content)
-
-        if fmt == "anthropic":
-            exported.append({
-                "messages": [
-                    {"role": "user", "content": instruction or content},
-                    {"role": "assistant", "content": response},
-                ]
-            })
-        elif fmt == "openai":
-            exported.append({
-                "messages": [
-                    {"role": "system", "content": "You are a helpful assistant."},
-                    {"role": "user", "content": instruction or content},
-                    {"role": "assistant", "content": response},
-                ]
-            })
-        elif fmt == "alpaca":
-            exported.append({
-                "instruction": instruction or content,
-                "input": "",
-                "output": response,
-            })
-        elif fmt == "sharegpt":
-            exported.append({
-                "conversations": [
-                    {"from": "human", "value": instruction or content},
-                    {"from": "gpt", "value": response},
-                ]
-            })
-        elif fmt == "jsonl":
-            # Passthrough with ixC metadata
-            exported.append(entry)
-        else:
-            exported.append(entry)
 
-    return exported
+def _to_openai(prompt: str, response: Any) -> Dict[str, Any]:
+    return {
+        "messages": [
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": prompt},
+            {"role": "assistant", "content": response},
+        ]
+    }
+
+
+def _to_alpaca(prompt: str, response: Any) -> Dict[str, Any]:
+    return {
+        "instruction": prompt,
+        "input": "",
+        "output": response,
+    }
+
+
+def _to_sharegpt(prompt: str, response: Any) -> Dict[str, Any]:
+    return {
+        "conversations": [
+            {"from": "human", "value": prompt},
+            {"from": "gpt", "value": response},
+        ]
+    }
+
+
+# Training formats built from (prompt, response); any other format,
+# including "jsonl", passes entries through with their ixC metadata
+_EXPORTERS = {
+    "anthropic": _to_anthropic,
+    "openai": _to_openai,
+    "alpaca": _to_alpaca,
+    "sharegpt": _to_sharegpt,
+}
+
+
+def stage_export(entries: Iterable[Dict[str, Any]], fmt: str) -> Iterator[Dict[str, Any]]:
+    """Convert entries to training format, lazily."""
+    to_format = _EXPORTERS.get(fmt)
+    if to_format is None:
+        # Passthrough with ixC metadata
+        return iter(entries)
+
+    def export() -> Iterator[Dict[str, Any]]:
+        for entry in entries:
+            content = entry.get("content", "")
+            instruction = entry.get("instruction", entry.get("intent", ""))
+            response = entry.get("response", content)
+            yield to_format(instruction or content, response)
+
+    return export()
 
 
 def write_output(data: Any, output_path: Path, as_jsonl: bool = True):
-    """Write output as JSON or JSONL."""
+    """
+    Write output as JSON or JSONL.
+
+    For JSONL, data may be any iterable of entries (such as a chain of
+    stage iterators); it is consumed as it is written. Output goes to a
+    temporary file beside output_path that replaces it once complete, so
+    an input streamed from the same path is read in full before it is
+    overwritten, and a failed run leaves any earlier output intact.
+    """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with output_path.open("w", encoding="utf-8") as f:
-        if as_jsonl and isinstance(data, list):
-            for item in data:
-                json.dump(item, f, ensure_ascii=False)
-                f.write("\n")
+    with _replacing(output_path) as tmp_path:
+        if as_jsonl and not isinstance(data, dict):
+            with open(tmp_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+                for item in data:
+                    f.write(dumps_line(item))
         else:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
 
     print(f"Output written to: {output_path}")
 
 
-def main():
+@contextmanager
+def _replacing(output_path: Path) -> Iterator[str]:
+    """
+    Yield a temporary path in output_path's directory; on success it
+    replaces output_path, on error it is removed.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        yield tmp_path
+        # mkstemp creates the file owner-only; give it the permissions a
+        # plain open() would have
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _count_into(entries: Iterable[Any], counts: Counter, key: str) -> Iterator[Any]:
+    """Pass entries through, counting them under counts[key]."""
+    for entry in entries:
+        counts[key] += 1
+        yield entry
+
+
+def _count_by(entries: Iterable[Any], counter: Counter, key_fn: Callable[[Any], Any]) -> Iterator[Any]:
+    """Pass entries through, counting them under counter[key_fn(entry)]."""
+    for entry in entries:
+        counter[key_fn(entry)] += 1
+        yield entry
+
+
+def _print_load_summary(counts: Counter, normalized: bool):
+    print(f"Loaded {counts['loaded']} entries")
+    if normalized:
+        print(f"  Normalized to {counts['normalized']} entries")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     parser = argparse.ArgumentParser(
         description="indexConstellation — Unified Pipeline Runner",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -285,8 +499,16 @@ Examples:
     parser.add_argument("--max-content-rating", choices=["clean", "mature", "suggestive", "explicit"], help="Maximum content rating to include")
     parser.add_argument("--format", "-f", choices=["jsonl", "anthropic", "openai", "alpaca", "sharegpt"], default="jsonl", help="Output format")
     parser.add_argument("--source", default="ixc-pipeline", help="Source identifier for provenance")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for scoring (default: 1, in-process)",
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
 
     input_path = Path(args.input)
     output_path = Path(args.output)
@@ -296,18 +518,19 @@ Examples:
     print(f"Output: {output_path}")
     print()
 
-    # Load
-    entries = load_input(input_path)
-    print(f"Loaded {len(entries)} entries")
+    counts = Counter()
 
-    # Normalize
-    if args.normalize:
-        print("\n── Stage: NDRP Normalization ──")
-        entries = stage_normalize(entries, source=args.source)
-        print(f"  Normalized to {len(entries)} entries")
+    # Load
+    entries = _count_into(iter_input(input_path), counts, "loaded")
 
     # Validate
     if args.validate:
+        # Validation reports on the whole entry list at once
+        if args.normalize:
+            print("── Stage: NDRP Normalization ──")
+            entries = _count_into(stage_normalize(entries, source=args.source), counts, "normalized")
+        entries = list(entries)
+        _print_load_summary(counts, args.normalize)
         print("\n── Stage: NDRP Validation ──")
         report = stage_validate(entries)
         print(f"  Checked: {report['entries_checked']}")
@@ -316,23 +539,32 @@ Examples:
         for line in report.get("summary", []):
             print(f"  → {line}")
         write_output(report, output_path, as_jsonl=False)
-        return
+        return 0
+
+    # The stages below are chained lazily: each entry flows through all of
+    # them and is written before the next one is read. Counts are gathered
+    # on the way and reported once the output is written.
+
+    # Normalize
+    if args.normalize:
+        print("── Stage: NDRP Normalization ──")
+        entries = _count_into(stage_normalize(entries, source=args.source), counts, "normalized")
 
     # Score
+    tiers = Counter()
     if args.score:
-        print("\n── Stage: DiamondScorer v3.0 ──")
-        entries = stage_score(entries)
-        tiers = {}
-        for e in entries:
-            t = e.get("ixc_tier", "unknown")
-            tiers[t] = tiers.get(t, 0) + 1
-        for tier, count in sorted(tiers.items()):
-            print(f"  {tier}: {count}")
+        print("── Stage: DiamondScorer v3.0 ──")
+        entries = _count_by(
+            stage_score(entries, workers=args.workers),
+            tiers,
+            lambda entry: entry.get("ixc_tier", "unknown"),
+        )
 
     # Filter
-    if args.min_tier or args.exclude_flags or args.max_content_rating:
-        print("\n── Stage: Filter ──")
-        before = len(entries)
+    filtering = bool(args.min_tier or args.exclude_flags or args.max_content_rating)
+    if filtering:
+        print("── Stage: Filter ──")
+        entries = _count_into(entries, counts, "before_filter")
         exclude_flags = args.exclude_flags.split(",") if args.exclude_flags else None
         entries = stage_filter(
             entries,
@@ -340,18 +572,29 @@ Examples:
             exclude_flags=exclude_flags,
             content_rating_max=args.max_content_rating,
         )
-        print(f"  {before} → {len(entries)} entries (filtered {before - len(entries)})")
 
     # Export
     if args.format != "jsonl":
-        print(f"\n── Stage: Export ({args.format}) ──")
+        print(f"── Stage: Export ({args.format}) ──")
         entries = stage_export(entries, args.format)
 
     # Write
     print()
-    write_output(entries, output_path)
-    print(f"Pipeline complete. {len(entries)} entries written.")
+    write_output(_count_into(entries, counts, "written"), output_path)
+
+    print()
+    _print_load_summary(counts, args.normalize)
+    if args.score:
+        print("\n── DiamondScorer v3.0 ──")
+        for tier, count in sorted(tiers.items()):
+            print(f"  {tier}: {count}")
+    if filtering:
+        before = counts["before_filter"]
+        print("\n── Filter ──")
+        print(f"  {before} → {counts['written']} entries (filtered {before - counts['written']})")
+    print(f"\nPipeline complete. {counts['written']} entries written.")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,63 @@
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from pipeline import runner
+
+
+ENTRIES = [
+    {"content": "Because the cache is warm, the second lookup is faster; therefore we reuse it."},
+    {"content": "Short note."},
+    {"content": "First, parse the file. Then, validate each entry and write the report."},
+]
+
+
+def run(argv):
+    with redirect_stdout(io.StringIO()):
+        return runner.main(argv)
+
+
+class RunnerOutputTests(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.tmpdir = Path(self._tmpdir.name)
+        self.data_path = self.tmpdir / "data.jsonl"
+        self.data_path.write_text("".join(json.dumps(e) + "\n" for e in ENTRIES), encoding="utf-8")
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def read_jsonl(self, path):
+        return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+    def test_output_may_overwrite_its_input(self):
+        self.assertEqual(run(["-i", str(self.data_path), "-o", str(self.data_path), "--score"]), 0)
+
+        written = self.read_jsonl(self.data_path)
+        self.assertEqual([e["content"] for e in written], [e["content"] for e in ENTRIES])
+        self.assertTrue(all("ixc_tier" in e for e in written))
+        self.assertEqual(list(self.tmpdir.glob("*.tmp")), [])
+
+    def test_same_file_through_another_path(self):
+        alias = self.tmpdir / "." / "data.jsonl"
+        self.assertEqual(run(["-i", str(self.data_path), "-o", str(alias), "--format", "alpaca"]), 0)
+
+        written = self.read_jsonl(self.data_path)
+        self.assertEqual([e["instruction"] for e in written], [e["content"] for e in ENTRIES])
+
+    def test_failed_run_keeps_previous_output(self):
+        output_path = self.tmpdir / "out.jsonl"
+        output_path.write_text("previous\n", encoding="utf-8")
+
+        with self.assertRaises(SystemExit):
+            run(["-i", str(self.tmpdir / "missing.jsonl"), "-o", str(output_path)])
+
+        self.assertEqual(output_path.read_text(encoding="utf-8"), "previous\n")
+        self.assertEqual(list(self.tmpdir.glob("*.tmp")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()